@@ -8,6 +8,17 @@ import altair as alt
 # ---------- Paths & constants ----------
 PROC_PATH = os.path.join("data", "processed", "aibps_monthly.csv")
 
+# Named Vega-Lite dataset that chart specs read their plotted data from
+CHART_DATASET = "source"
+
+# Composite regime bands: thresholds split 0–100 into the labelled regimes
+REGIME_THRESHOLDS = np.array([25.0, 50.0, 75.0])
+REGIME_LABELS = np.array(["Low", "Elevated", "High", "Extreme"])
+REGIME_COLORS = np.array(["#d9f0d3", "#ffffbf", "#fee090", "#fc8d59"])
+
+# Per-series point budget for line charts; longer series are LTTB-decimated
+MAX_LINE_POINTS = 400
+
 # The pillars we conceptually care about
 PILLAR_CANDIDATES = [
     "Market",
@@ -18,6 +29,503 @@ PILLAR_CANDIDATES = [
     "Sentiment",
 ]
 
+
+@st.cache_data(show_spinner=False)
+def load_processed(path: str, mtime: float) -> pd.DataFrame:
+    """
+    Read a processed CSV (first column = date index), sorted by date.
+
+    `mtime` is only used as part of the cache key, so the file is parsed
+    once per version on disk instead of on every rerun.
+    """
+    # Arrow's CSV parser (multithreaded, exact float parsing) needs the date
+    # column by name; pandas' C engine is the fallback without pyarrow
+    date_col = pd.read_csv(path, nrows=0).columns[0]
+    try:
+        df = pd.read_csv(path, index_col=0, parse_dates=[date_col], engine="pyarrow")
+    except ImportError:
+        df = pd.read_csv(path, index_col=0, parse_dates=True)
+    return df.sort_index()
+
+
+def read_processed(path: str) -> pd.DataFrame:
+    """Cached read of a processed CSV, keyed on its modification time."""
+    return load_processed(path, os.path.getmtime(path))
+
+
+@st.cache_data(show_spinner=False)
+def load_pillar_matrix(_df: pd.DataFrame, mtime: float, pillars: tuple) -> np.ndarray:
+    """
+    Pillar block of the composite as a contiguous float64 array (rows x pillars).
+
+    Missing values are zero-filled so `pillar_mat @ weights` matches the
+    NaN-skipping weighted sum. Cached per file version and pillar set.
+    """
+    return np.nan_to_num(_df[list(pillars)].to_numpy(dtype=np.float64, copy=True))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Row positions kept by Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the mean of the next bucket, which preserves peaks and troughs.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def downsample_long(
+    data: pd.DataFrame,
+    series_col: str,
+    value_col: str = "Value",
+    max_points: int = MAX_LINE_POINTS,
+) -> pd.DataFrame:
+    """
+    LTTB-decimate each series of a long (date, series, value) frame to `max_points`.
+
+    Each run of non-missing values is decimated on its own, with the budget
+    shared by run length, and the first missing row of every interior gap is
+    kept so the line still breaks there. Leading/trailing missing rows are
+    dropped; series already within budget keep all non-missing rows. Callers
+    that want continuous lines drop the missing rows first.
+    """
+    keep = []
+    for _, grp in data.groupby(series_col, sort=False):
+        x = grp["date"].to_numpy(dtype="datetime64[ns]").astype(np.float64)
+        y = grp[value_col].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(y)
+        n_valid = int(valid.sum())
+        if n_valid == 0:
+            continue
+
+        # [start, stop) of each run of valid rows
+        flips = np.flatnonzero(np.diff(valid.astype(np.int8))) + 1
+        bounds = np.concatenate(([0], flips, [len(y)]))
+        starts, stops = bounds[:-1], bounds[1:]
+        run_valid = valid[starts]
+        valid_starts, valid_stops = starts[run_valid], stops[run_valid]
+
+        pos = []
+        for lo, hi in zip(valid_starts, valid_stops):
+            budget = int(round(max_points * (hi - lo) / n_valid))
+            pos.append(lo + lttb_indices(x[lo:hi], y[lo:hi], budget))
+        # One missing row per gap between valid runs breaks the line
+        pos.append(valid_stops[:-1])
+
+        keep.append(grp.index.to_numpy()[np.sort(np.concatenate(pos))])
+    if not keep:
+        return data.iloc[:0]
+    return data.loc[np.concatenate(keep)]
+
+
+def show_vega_lite(spec: dict, data: pd.DataFrame) -> None:
+    """
+    Render a Vega-Lite spec whose plotted layer reads the named dataset CHART_DATASET.
+
+    `data` is attached under that name, so Streamlit ships it to the browser
+    as an Arrow table rather than Altair inlining it as row-wise JSON.
+    """
+    spec = dict(spec)
+    spec["datasets"] = {**spec.get("datasets", {}), CHART_DATASET: data}
+    st.vega_lite_chart(spec=spec, use_container_width=True)
+
+
+def weight_param(pillar: str) -> str:
+    """Name of the Vega-Lite parameter carrying a pillar's normalized weight."""
+    return f"w_{pillar}"
+
+
+@st.cache_data(show_spinner=False)
+def composite_chart_spec(
+    comp_label: str,
+    pillars: tuple,
+    raw_field: str | None,
+    ra_field: str | None,
+    use_ra: bool,
+) -> dict:
+    """
+    Vega-Lite spec for the composite chart (bands + regime lines + event markers).
+
+    Built with Altair once per label / composite source and cached. The regime
+    bands, threshold rules and event markers are constants inlined into the
+    spec as `values`; only the AIBPS line reads per-rerun data, the wide
+    pillar table in the named dataset CHART_DATASET, and derives the
+    composite with Vega-Lite transforms:
+
+    - raw_field=None: weighted sum of `pillars` using the `w_<pillar>`
+      parameters (missing pillars count as 0), i.e. the in-app composite.
+    - otherwise: the precomputed column `raw_field`.
+    - ra_field=None: 3-period trailing mean of the raw composite, else the
+      precomputed column `ra_field`.
+
+    Weight values are injected as top-level params at render time, so slider
+    changes neither rebuild the spec nor recompute the series in Python.
+    """
+    if raw_field is None:
+        raw_expr = " + ".join(
+            f"(isValid(datum['{p}']) ? datum['{p}'] : 0) * {weight_param(p)}" for p in pillars
+        )
+    else:
+        raw_expr = f"datum['{raw_field}']"
+    band_edges = np.concatenate(([0.0], REGIME_THRESHOLDS, [100.0])).tolist()
+    band_values = [
+        {"ymin": lo, "ymax": hi, "label": label}
+        for lo, hi, label in zip(band_edges[:-1], band_edges[1:], REGIME_LABELS.tolist())
+    ]
+
+    band_colors = dict(zip(REGIME_LABELS.tolist(), REGIME_COLORS.tolist()))
+
+    # No x encoding: the rects span the full plot width, whatever the date range
+    bands = (
+        alt.Chart(alt.InlineData(values=band_values))
+        .mark_rect(opacity=0.35)
+        .encode(
+            y="ymin:Q",
+            y2="ymax:Q",
+            color=alt.Color(
+                "label:N",
+                scale=alt.Scale(
+                    domain=list(band_colors.keys()),
+                    range=list(band_colors.values()),
+                ),
+                legend=alt.Legend(title="Regime"),
+            ),
+        )
+    )
+
+    # Horizontal regime threshold lines at 25/50/75
+    regime_rules = (
+        alt.Chart(alt.InlineData(values=[{"y": t} for t in REGIME_THRESHOLDS.tolist()]))
+        .mark_rule(strokeDash=[3, 3], color="black", opacity=0.5)
+        .encode(
+            y="y:Q",
+        )
+    )
+
+    aibps_line = alt.Chart(alt.NamedData(CHART_DATASET)).transform_calculate(
+        Composite_raw=raw_expr
+    )
+    if ra_field is None:
+        aibps_line = aibps_line.transform_window(
+            Composite_RA="mean(Composite_raw)",
+            frame=[-2, 0],
+            sort=[alt.SortField("date")],
+        )
+    else:
+        aibps_line = aibps_line.transform_calculate(Composite_RA=f"datum['{ra_field}']")
+
+    aibps_line = (
+        aibps_line.transform_calculate(
+            Composite="datum.Composite_RA" if use_ra else "datum.Composite_raw"
+        )
+        .mark_line(strokeWidth=3)
+        .encode(
+            x=alt.X("date:T", title="Date"),
+            y=alt.Y(
+                "Composite:Q",
+                title="AIBPS (0–100)",
+                scale=alt.Scale(domain=[0, 100]),
+            ),
+            tooltip=[
+                alt.Tooltip("date:T", title="Date"),
+                alt.Tooltip("Composite:Q", title=comp_label, format=".1f"),
+            ],
+        )
+        # x-only pan/zoom: the y domain is fixed at 0–100
+        .add_params(alt.selection_interval(bind="scales", encodings=["x"]))
+    )
+
+    event_data = alt.InlineData(
+        values=[
+            {"date": "2000-03-01", "label": "Dot-com peak", "ypos": 12},
+            {"date": "2006-07-01", "label": "US housing peak", "ypos": 26},
+            {"date": "2007-10-01", "label": "Pre-GFC peak", "ypos": 40},
+            {"date": "2008-09-15", "label": "Lehman", "ypos": 54},
+            {"date": "2023-03-15", "label": "AI boom", "ypos": 68},
+        ]
+    )
+
+    event_rules = (
+        alt.Chart(event_data)
+        .mark_rule(strokeDash=[4, 4], color="gray")
+        .encode(
+            x="date:T",
+            tooltip=[
+                alt.Tooltip("label:N", title="Event"),
+                alt.Tooltip("date:T", title="Date"),
+            ],
+        )
+    )
+
+    event_labels = (
+        alt.Chart(event_data)
+        .mark_text(
+            align="left",
+            baseline="middle",
+            dx=5,
+            dy=0,
+            color="gray",
+            fontSize=11,
+        )
+        .encode(
+            x="date:T",
+            y=alt.Y("ypos:Q", scale=alt.Scale(domain=[0, 100])),
+            text="label:N",
+        )
+    )
+
+    composite_chart = (
+        (bands + regime_rules + aibps_line + event_rules + event_labels)
+        .properties(height=420)
+    )
+    spec = composite_chart.to_dict()
+
+    # Altair hoists the constant layers' values into top-level datasets, which
+    # Streamlit would convert to Arrow on every rerun; keep them inline instead
+    datasets = spec.pop("datasets", {})
+    for layer in spec["layer"]:
+        name = layer.get("data", {}).get("name")
+        if name in datasets:
+            layer["data"] = {"values": datasets[name]}
+    return spec
+
+
+@st.cache_data(show_spinner=False)
+def component_line_spec(pillar: str) -> dict:
+    """
+    Vega-Lite spec for a pillar's subcomponent time series (long: date, Component, Value).
+
+    Shared by the Capex / Infra / Adoption debug panels and cached per pillar,
+    so reruns rebind data instead of re-encoding the chart with Altair.
+    """
+    chart = (
+        alt.Chart(alt.NamedData(CHART_DATASET))
+        .mark_line()
+        .encode(
+            x=alt.X("date:T", title="Date"),
+            y=alt.Y(
+                "Value:Q",
+                title="Visual index (0–100 per component)",
+                scale=alt.Scale(domain=[0, 100]),
+            ),
+            color=alt.Color("Component:N", title=f"{pillar} Component"),
+            tooltip=[
+                alt.Tooltip("date:T", title="Date"),
+                alt.Tooltip("Component:N", title="Component"),
+                alt.Tooltip(
+                    "Value:Q",
+                    title="Visual index (0–100)",
+                    format=".1f",
+                ),
+            ],
+        )
+        .properties(
+            height=260,
+            title=f"{pillar} components over time (visually normalized per series)",
+        )
+    )
+    return chart.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def component_bar_spec(pillar: str) -> dict:
+    """Vega-Lite spec for a pillar's latest subcomponent snapshot (Component, Value)."""
+    chart = (
+        alt.Chart(alt.NamedData(CHART_DATASET))
+        .mark_bar()
+        .encode(
+            x=alt.X(
+                "Component:N",
+                title=f"{pillar} Component",
+                sort="-y",
+            ),
+            y=alt.Y(
+                "Value:Q",
+                title="Visual index (0–100)",
+                scale=alt.Scale(domain=[0, 100]),
+            ),
+            tooltip=[
+                alt.Tooltip("Component:N", title="Component"),
+                alt.Tooltip(
+                    "Value:Q",
+                    title="Visual index (0–100)",
+                    format=".1f",
+                ),
+            ],
+        )
+        .properties(height=260)
+    )
+    return chart.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def series_line_spec(y_title: str, value_format: str) -> dict:
+    """
+    Vega-Lite spec for a long (date, Series, Value) debug chart with zoom/pan.
+
+    Used by the Market / Credit / Sentiment debug panels; cached per axis title.
+    """
+    chart = (
+        alt.Chart(alt.NamedData(CHART_DATASET))
+        .mark_line()
+        .encode(
+            x=alt.X("date:T", title="Date"),
+            y=alt.Y("Value:Q", title=y_title),
+            color="Series:N",
+            tooltip=[
+                alt.Tooltip("date:T", title="Date"),
+                alt.Tooltip("Series:N", title="Series"),
+                alt.Tooltip("Value:Q", title="Value", format=value_format),
+            ],
+        )
+        .properties(height=260)
+        .interactive()
+    )
+    return chart.to_dict()
+
+
+def render_component_debug(
+    pillar: str,
+    path: str,
+    component_cols,
+    help_text: str,
+    baseline_note: str,
+    default_exclude=(),
+) -> None:
+    """
+    Diagnostic view for a pillar's subcomponents (shared by Capex / Infra / Adoption).
+
+    Parameters
+    ----------
+    pillar : str
+        Display name used in headings and messages (e.g. "Capex").
+    path : str
+        Processed CSV holding the subcomponent columns.
+    component_cols : callable
+        Maps the file's column list to the selectable subcomponent columns.
+    help_text : str
+        Help tooltip for the component multiselect.
+    baseline_note : str
+        Baseline description shown with the raw tail (e.g. "baseline ≈ 100").
+    default_exclude : sequence of str
+        Columns left out of the default selection (e.g. the pillar composite).
+    """
+    st.markdown(f"### {pillar} subcomponents (diagnostic view)")
+
+    fname = os.path.basename(path)
+    if not os.path.exists(path):
+        st.warning(f"`{path}` not found. Run the update-data workflow first.")
+        return
+
+    try:
+        comp_df = read_processed(path)
+    except Exception as e:
+        st.error(f"Failed to read `{path}`: {e}")
+        return
+
+    if comp_df.empty:
+        st.info(f"{fname} is empty.")
+        return
+
+    # 1) Identify the subcomponent columns in the processed file
+    cols = component_cols(list(comp_df.columns))
+    if not cols:
+        st.info(f"No {pillar}_* subcomponent columns found in {fname}.")
+        return
+
+    # 2) Let user choose which components to visualize
+    default_selection = [c for c in cols if c not in default_exclude] or cols
+    selected_cols = st.multiselect(
+        f"Select {pillar} components to display",
+        options=cols,
+        default=default_selection,
+        help=help_text,
+    )
+
+    if not selected_cols:
+        st.warning(f"Select at least one {pillar} component to view.")
+        return
+
+    # 3) Show raw tail (true index values, can go >>100)
+    st.markdown(f"**Latest 12 months — raw {pillar} indices ({baseline_note})**")
+    st.dataframe(comp_df[selected_cols].tail(12))
+
+    # 4) Build visually normalized copy (0–100 per component) for charts
+    vis_df = comp_df[selected_cols].copy()
+    for col in vis_df.columns:
+        col_min = vis_df[col].min()
+        col_max = vis_df[col].max()
+        if pd.isna(col_min) or pd.isna(col_max) or col_min == col_max:
+            # If no variation, park it at midline so it's visible but flat
+            vis_df[col] = 50.0
+        else:
+            vis_df[col] = 100.0 * (vis_df[col] - col_min) / (col_max - col_min)
+
+    # 5) Time-series chart (visually normalized 0–100 so all lines "alive")
+    vis_long = downsample_long(
+        vis_df
+        .reset_index(names="date")
+        .melt(id_vars="date", var_name="Component", value_name="Value"),
+        series_col="Component",
+    )
+
+    show_vega_lite(component_line_spec(pillar), vis_long)
+
+    # 6) Current-date contribution snapshot (visually normalized bar)
+    latest_idx = vis_df.dropna(how="all").index.max()
+    if pd.isna(latest_idx):
+        st.info(f"No valid recent data to compute current {pillar} contributions.")
+        return
+
+    latest_vals = vis_df.loc[latest_idx, selected_cols].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(latest_vals)
+    if not valid.any():
+        st.info(f"Latest row has no non-missing {pillar} values (visual).")
+        return
+
+    # Tiny (component, value) table built straight from the NumPy row
+    contrib_df = pd.DataFrame(
+        {
+            "Component": np.asarray(selected_cols, dtype=str)[valid],
+            "Value": latest_vals[valid],
+        }
+    )
+
+    st.markdown(
+        f"**Current {pillar} contributions (visual scale)** "
+        f"(as of `{latest_idx.date()}`, 0–100 per component)"
+    )
+
+    show_vega_lite(component_bar_spec(pillar), contrib_df)
+
+    top = int(np.argmax(contrib_df["Value"].to_numpy()))
+    st.caption(
+        f"Visual-only: each {pillar} component is rescaled to 0–100 over its own history. "
+        f"At the latest date, the relatively strongest component (within this visual scale) "
+        f"is **{contrib_df['Component'].iat[top]}** (~{contrib_df['Value'].iat[top]:.1f}/100)."
+    )
+
+
 # ---------- Page config ----------
 st.set_page_config(
     page_title="AI Bubble Pressure Score",
@@ -35,7 +543,7 @@ if not os.path.exists(PROC_PATH):
     st.error(f"Composite file not found at `{PROC_PATH}`. Run the GitHub Action first.")
     st.stop()
 
-df = pd.read_csv(PROC_PATH, index_col=0, parse_dates=True).sort_index()
+df = read_processed(PROC_PATH)
 if df.empty:
     st.error("Composite file is empty. Check workflows / processed inputs.")
     st.stop()
@@ -63,18 +571,23 @@ with st.sidebar:
 
     st.markdown(
         "Adjust the relative importance of each pillar. "
-        "Weights are rescaled to sum to 1 for the composite."
+        "Weights are rescaled to sum to 1 for the composite; "
+        "press **Apply weights** to update."
     )
 
-    weight_inputs = {}
-    for p in available_pillars:
-        weight_inputs[p] = st.slider(
-            label=f"{p} weight",
-            min_value=0.0,
-            max_value=3.0,
-            value=1.0,
-            step=0.1,
-        )
+    # Sliders live in a form so a burst of drags triggers one rerun on "Apply"
+    # instead of a full script run per slider tick.
+    with st.form("weights_form", border=False):
+        weight_inputs = {}
+        for p in available_pillars:
+            weight_inputs[p] = st.slider(
+                label=f"{p} weight",
+                min_value=0.0,
+                max_value=3.0,
+                value=1.0,
+                step=0.1,
+            )
+        st.form_submit_button("Apply weights")
 
     w_vec = np.array([weight_inputs[p] for p in available_pillars], dtype=float)
     if w_vec.sum() == 0:
@@ -103,54 +616,41 @@ with st.sidebar:
     )
 
 # ---------- Prepare composite (in-app and/or precomputed) ----------
+# The composite series is derived in the browser by the chart's Vega-Lite
+# transforms (see composite_chart_spec); Python only needs the latest reading.
 
-pillars_df = df[available_pillars].copy()
-
-# In-app composite from pillar weights
-comp_in_app_raw = (pillars_df * weights).sum(axis=1)
-comp_in_app_ra = comp_in_app_raw.rolling(3, min_periods=1).mean()
+has_raw = "AIBPS" in df.columns
+has_ra = "AIBPS_RA" in df.columns
+use_ra = plot_series.startswith("Rolling")
 
-# Precomputed composite from CSV (if present)
-precomp_raw = df["AIBPS"] if "AIBPS" in df.columns else None
-precomp_ra = df["AIBPS_RA"] if "AIBPS_RA" in df.columns else None
-
-if composite_source == "In-app recomputed":
-    comp_raw = comp_in_app_raw
-    comp_ra = comp_in_app_ra
+if composite_source == "In-app recomputed" or not (has_raw or has_ra):
+    raw_field, ra_field = None, None
     comp_label = "AIBPS (in-app composite)"
 else:
-    if precomp_ra is not None:
-        comp_ra = precomp_ra
-        comp_raw = precomp_raw if precomp_raw is not None else precomp_ra
-        comp_label = "AIBPS (precomputed)"
-    elif precomp_raw is not None:
-        comp_raw = precomp_raw
-        comp_ra = precomp_raw.rolling(3, min_periods=1).mean()
-        comp_label = "AIBPS (precomputed)"
-    else:
-        comp_raw = comp_in_app_raw
-        comp_ra = comp_in_app_ra
-        comp_label = "AIBPS (in-app composite)"
-
-comp_df = pd.DataFrame(
-    {
-        "Composite_raw": comp_raw,
-        "Composite_RA": comp_ra,
-    }
-).dropna(how="all")
-
-if comp_df.empty:
-    st.error("Composite series is empty after combining. Check inputs.")
-    st.stop()
-
-if plot_series.startswith("Rolling"):
-    comp_df["Composite"] = comp_df["Composite_RA"]
+    raw_field = "AIBPS" if has_raw else "AIBPS_RA"
+    ra_field = "AIBPS_RA" if has_ra else None
+    comp_label = "AIBPS (precomputed)"
+
+if raw_field is None:
+    # In-app composite: the latest RA only needs the last three rows
+    pillar_mat = load_pillar_matrix(df, os.path.getmtime(PROC_PATH), tuple(available_pillars))
+    tail = pillar_mat[-3:] @ w_vec
+    latest_comp_date = df.index[-1]
+    latest_raw, latest_ra = tail[-1], tail.mean()
 else:
-    comp_df["Composite"] = comp_df["Composite_raw"]
+    valid = df[[c for c in (raw_field, ra_field) if c is not None]].dropna(how="all")
+    if valid.empty:
+        st.error("Composite series is empty after combining. Check inputs.")
+        st.stop()
+    latest_comp_date = valid.index[-1]
+    latest_raw = df.loc[latest_comp_date, raw_field]
+    if ra_field is not None:
+        latest_ra = df.loc[latest_comp_date, ra_field]
+    else:
+        latest_ra = df.loc[:latest_comp_date, raw_field].tail(3).mean()
 
 # ---------- Top summary ----------
-latest_comp_date = comp_df.index.max()
-latest_val = comp_df.loc[latest_comp_date, "Composite"]
+latest_val = latest_ra if use_ra else latest_raw
 latest_str = latest_comp_date.strftime("%Y-%m-%d")
 
 col_a, col_b, col_c = st.columns(3)
@@ -167,120 +667,15 @@ st.markdown("---")
 
 st.subheader("AI Bubble Pressure Score over time")
 
-df_plot = comp_df.reset_index().rename(columns={"index": "date"})
-
-x_min = df_plot["date"].min()
-x_max = df_plot["date"].max()
+# Wide pillar table (plus precomputed composite); invariant across slider changes
+plot_cols = available_pillars + [c for c in ("AIBPS", "AIBPS_RA") if c in df.columns]
+df_plot = df[plot_cols].reset_index()
 
-bands_df = pd.DataFrame(
-    [
-        {"date_start": x_min, "date_end": x_max, "ymin": 0, "ymax": 25, "label": "Low"},
-        {"date_start": x_min, "date_end": x_max, "ymin": 25, "ymax": 50, "label": "Elevated"},
-        {"date_start": x_min, "date_end": x_max, "ymin": 50, "ymax": 75, "label": "High"},
-        {"date_start": x_min, "date_end": x_max, "ymin": 75, "ymax": 100, "label": "Extreme"},
-    ]
-)
-
-band_colors = {
-    "Low": "#d9f0d3",
-    "Elevated": "#ffffbf",
-    "High": "#fee090",
-    "Extreme": "#fc8d59",
-}
-
-bands = (
-    alt.Chart(bands_df)
-    .mark_rect(opacity=0.35)
-    .encode(
-        x=alt.X("date_start:T", title="Date"),
-        x2="date_end:T",
-        y="ymin:Q",
-        y2="ymax:Q",
-        color=alt.Color(
-            "label:N",
-            scale=alt.Scale(
-                domain=list(band_colors.keys()),
-                range=list(band_colors.values()),
-            ),
-            legend=alt.Legend(title="Regime"),
-        ),
-    )
-)
-
-# Horizontal regime threshold lines at 25/50/75
-thresholds_df = pd.DataFrame({"y": [25, 50, 75]})
-
-regime_rules = (
-    alt.Chart(thresholds_df)
-    .mark_rule(strokeDash=[3, 3], color="black", opacity=0.5)
-    .encode(
-        y="y:Q",
-    )
-)
-
-aibps_line = (
-    alt.Chart(df_plot)
-    .mark_line(strokeWidth=3)
-    .encode(
-        x=alt.X("date:T", title="Date"),
-        y=alt.Y(
-            "Composite:Q",
-            title="AIBPS (0–100)",
-            scale=alt.Scale(domain=[0, 100]),
-        ),
-        tooltip=[
-            alt.Tooltip("date:T", title="Date"),
-            alt.Tooltip("Composite:Q", title=comp_label, format=".1f"),
-        ],
-    )
-)
-
-event_data = pd.DataFrame(
-    [
-        {"date": pd.Timestamp("2000-03-01"), "label": "Dot-com peak", "ypos": 12},
-        {"date": pd.Timestamp("2006-07-01"), "label": "US housing peak", "ypos": 26},
-        {"date": pd.Timestamp("2007-10-01"), "label": "Pre-GFC peak", "ypos": 40},
-        {"date": pd.Timestamp("2008-09-15"), "label": "Lehman", "ypos": 54},
-        {"date": pd.Timestamp("2023-03-15"), "label": "AI boom", "ypos": 68},
-    ]
-)
-
-event_rules = (
-    alt.Chart(event_data)
-    .mark_rule(strokeDash=[4, 4], color="gray")
-    .encode(
-        x="date:T",
-        tooltip=[
-            alt.Tooltip("label:N", title="Event"),
-            alt.Tooltip("date:T", title="Date"),
-        ],
-    )
-)
-
-event_labels = (
-    alt.Chart(event_data)
-    .mark_text(
-        align="left",
-        baseline="middle",
-        dx=5,
-        dy=0,
-        color="gray",
-        fontSize=11,
-    )
-    .encode(
-        x="date:T",
-        y=alt.Y("ypos:Q", scale=alt.Scale(domain=[0, 100])),
-        text="label:N",
-    )
-)
-
-composite_chart = (
-    (bands + regime_rules + aibps_line + event_rules + event_labels)
-    .properties(height=420)
-    .interactive()
-)
-
-st.altair_chart(composite_chart, use_container_width=True)
+spec = composite_chart_spec(comp_label, tuple(available_pillars), raw_field, ra_field, use_ra)
+spec["params"] = spec.get("params", []) + [
+    {"name": weight_param(p), "value": float(w)} for p, w in zip(available_pillars, w_vec)
+]
+show_vega_lite(spec, df_plot)
 
 # ----- Pillar trajectories (normalized 0–100) -----
 st.subheader("Pillar trajectories")
@@ -304,16 +699,14 @@ plot_cols = [col for col in pillar_map.keys() if col in available_cols]
 if not plot_cols:
     st.info("No pillar columns found to plot trajectories.")
 else:
-    traj_df = (
-        df[plot_cols]
-        .reset_index(names="date")
-        .melt(id_vars="date", var_name="Pillar", value_name="Value")
-    )
-    # Apply pretty labels
-    traj_df["Pillar"] = traj_df["Pillar"].map(pillar_map)
+    # Ship the compact wide table (pretty labels as columns) and let
+    # Vega-Lite fold it to long form in the browser
+    traj_df = df[plot_cols].rename(columns=pillar_map).reset_index(names="date")
+    traj_labels = [pillar_map[c] for c in plot_cols]
 
     traj_chart = (
-        alt.Chart(traj_df)
+        alt.Chart(alt.NamedData(CHART_DATASET))
+        .transform_fold(traj_labels, as_=["Pillar", "Value"])
         .mark_line()
         .encode(
             x=alt.X("date:T", title="Date"),
@@ -332,7 +725,7 @@ else:
         .properties(height=280)
     )
 
-    st.altair_chart(traj_chart, use_container_width=True)
+    show_vega_lite(traj_chart.to_dict(), traj_df)
 
 
 # ---------- Pillar-by-pillar debug: Market ----------
@@ -344,7 +737,7 @@ with st.expander("Market pillar debug"):
     if not os.path.exists(mkt_path):
         st.info("market_processed.csv not found. Run the update-data workflow first.")
     else:
-        mkt = pd.read_csv(mkt_path, index_col=0, parse_dates=True).sort_index()
+        mkt = read_processed(mkt_path)
         mkt.index.name = "date"
 
         # Identify component columns (everything except the main Market composite)
@@ -355,33 +748,17 @@ with st.expander("Market pillar debug"):
             st.info("No Market component series found to debug.")
         else:
             # Melt to long format for Altair
-            mkt_long = (
+            mkt_long = downsample_long(
                 mkt[show_cols]
                 .reset_index()
                 .melt(id_vars="date", var_name="Series", value_name="Value")
-                .dropna(subset=["Value"])
+                .dropna(subset=["Value"]),
+                series_col="Series",
             )
 
             st.write("Underlying Market components (rebased to 100 at first valid point):")
 
-            mkt_chart = (
-                alt.Chart(mkt_long)
-                .mark_line()
-                .encode(
-                    x=alt.X("date:T", title="Date"),
-                    y=alt.Y("Value:Q", title="Index (rebased to 100)"),
-                    color="Series:N",
-                    tooltip=[
-                        alt.Tooltip("date:T", title="Date"),
-                        alt.Tooltip("Series:N", title="Series"),
-                        alt.Tooltip("Value:Q", title="Value", format=".1f"),
-                    ],
-                )
-                .properties(height=260)
-                .interactive()
-            )
-
-            st.altair_chart(mkt_chart, use_container_width=True)
+            show_vega_lite(series_line_spec("Index (rebased to 100)", ".1f"), mkt_long)
 
             st.write("Tail of market_processed.csv:")
             st.dataframe(mkt.tail(10))
@@ -393,499 +770,64 @@ with st.expander("Credit pillar debug"):
     if not os.path.exists(credit_path):
         st.info("credit_fred_processed.csv not found. Run the update-data workflow first.")
     else:
-        credit = pd.read_csv(credit_path, index_col=0, parse_dates=True).sort_index()
+        credit = read_processed(credit_path)
         credit.index.name = "date"
 
         st.write("Underlying credit series (FRED):")
         st.dataframe(credit.tail(10))
 
         # Long format for Altair
-        credit_long = (
+        credit_long = downsample_long(
             credit.reset_index()
             .melt(id_vars="date", var_name="Series", value_name="Value")
-            .dropna(subset=["Value"])
-        )
-
-        credit_chart = (
-            alt.Chart(credit_long)
-            .mark_line()
-            .encode(
-                x=alt.X("date:T", title="Date"),
-                y=alt.Y("Value:Q", title="Level (native units)"),
-                color="Series:N",
-                tooltip=[
-                    alt.Tooltip("date:T", title="Date"),
-                    alt.Tooltip("Series:N", title="Series"),
-                    alt.Tooltip("Value:Q", title="Value", format=".2f"),
-                ],
-            )
-            .properties(height=260)
-            .interactive()
+            .dropna(subset=["Value"]),
+            series_col="Series",
         )
 
-        st.altair_chart(credit_chart, use_container_width=True)
-
-# ---------- Pillar-by-pillar debug: Capex ----------
-
-# -----------------------------
-# CAPEX / SUPPLY PILLAR DEBUG
-# -----------------------------
-
+        show_vega_lite(series_line_spec("Level (native units)", ".2f"), credit_long)
 
+# ---------- Pillar-by-pillar debug: Capex / Infra / Adoption ----------
 
 with st.expander("Capex pillar debug", expanded=False):
-    st.markdown("### Capex subcomponents (diagnostic view)")
-
-    macro_capex_path = "data/processed/macro_capex_processed.csv"
-
-    if not os.path.exists(macro_capex_path):
-        st.warning(f"`{macro_capex_path}` not found. Run the update-data workflow first.")
-    else:
-        try:
-            capex_df = (
-                pd.read_csv(macro_capex_path, parse_dates=["Date"])
-                .set_index("Date")
-                .sort_index()
-            )
-        except Exception as e:
-            st.error(f"Failed to read `{macro_capex_path}`: {e}")
-            capex_df = None
-
-        if capex_df is None or capex_df.empty:
-            st.info("macro_capex_processed.csv is empty.")
-        else:
-            # 1) Identify all Capex-related columns in the macro capex file
-            capex_cols = [c for c in capex_df.columns if c.startswith("Capex_")]
-            if not capex_cols:
-                st.info("No Capex_* columns found in macro_capex_processed.csv.")
-            else:
-                # 2) Let user choose which components to visualize
-                default_selection = [c for c in capex_cols if c != "Capex_Supply"] or capex_cols
-                selected_cols = st.multiselect(
-                    "Select Capex components to display",
-                    options=capex_cols,
-                    default=default_selection,
-                    help=(
-                        "Includes Capex_Macro_Comp, Capex_Semi_Activity, Capex_IT_Equip, "
-                        "Capex_Constr, Capex_Hyperscaler, Capex_Fab_Index, "
-                        "Capex_DC_Cost_Index, Capex_Supply (composite)."
-                    ),
-                )
-
-                if not selected_cols:
-                    st.warning("Select at least one Capex component to view.")
-                else:
-                    # 3) Show raw tail (true index values, baseline ~100 but can go >>100)
-                    st.markdown("**Latest 12 months — raw capex indices (baseline ≈ 100)**")
-                    st.dataframe(capex_df[selected_cols].tail(12))
-
-                    # 4) Build visually normalized copy (0–100 per component) for charts
-                    vis_df = capex_df[selected_cols].copy()
-                    for col in vis_df.columns:
-                        col_min = vis_df[col].min()
-                        col_max = vis_df[col].max()
-                        if pd.isna(col_min) or pd.isna(col_max) or col_min == col_max:
-                            # If no variation, park it at midline so it's visible but flat
-                            vis_df[col] = 50.0
-                        else:
-                            vis_df[col] = 100.0 * (vis_df[col] - col_min) / (col_max - col_min)
-
-                    # 5) Time-series chart (visually normalized 0–100 so all lines "alive")
-                    vis_long = (
-                        vis_df
-                        .reset_index(names="date")
-                        .melt(id_vars="date", var_name="Component", value_name="Value")
-                    )
-
-                    capex_ts = (
-                        alt.Chart(vis_long)
-                        .mark_line()
-                        .encode(
-                            x=alt.X("date:T", title="Date"),
-                            y=alt.Y(
-                                "Value:Q",
-                                title="Visual index (0–100 per component)",
-                                scale=alt.Scale(domain=[0, 100]),
-                            ),
-                            color=alt.Color("Component:N", title="Capex Component"),
-                            tooltip=[
-                                alt.Tooltip("date:T", title="Date"),
-                                alt.Tooltip("Component:N", title="Component"),
-                                alt.Tooltip(
-                                    "Value:Q",
-                                    title="Visual index (0–100)",
-                                    format=".1f"
-                                ),
-                            ],
-                        )
-                        .properties(
-                            height=260,
-                            title="Capex components over time (visually normalized per series)",
-                        )
-                    )
-                    st.altair_chart(capex_ts, use_container_width=True)
-
-                    # 6) Current-date contribution snapshot (visually normalized bar)
-                    latest_idx = vis_df.dropna(how="all").index.max()
-                    if pd.isna(latest_idx):
-                        st.info("No valid recent data to compute current Capex contributions.")
-                    else:
-                        latest_vis = vis_df.loc[latest_idx, selected_cols].dropna()
-                        if latest_vis.empty:
-                            st.info("Latest row has no non-missing Capex values (visual).")
-                        else:
-                            contrib_df = (
-                                latest_vis.reset_index()
-                                .rename(columns={"index": "Component", latest_idx: "Value"})
-                            )
-                            contrib_df["Component"] = contrib_df["Component"].astype(str)
-
-                            st.markdown(
-                                f"**Current Capex contributions (visual scale)** "
-                                f"(as of `{latest_idx.date()}`, 0–100 per component)"
-                            )
-
-                            capex_bar = (
-                                alt.Chart(contrib_df)
-                                .mark_bar()
-                                .encode(
-                                    x=alt.X(
-                                        "Component:N",
-                                        title="Capex Component",
-                                        sort="-y",
-                                    ),
-                                    y=alt.Y(
-                                        "Value:Q",
-                                        title="Visual index (0–100)",
-                                        scale=alt.Scale(domain=[0, 100]),
-                                    ),
-                                    tooltip=[
-                                        alt.Tooltip("Component:N", title="Component"),
-                                        alt.Tooltip(
-                                            "Value:Q",
-                                            title="Visual index (0–100)",
-                                            format=".1f",
-                                        ),
-                                    ],
-                                )
-                                .properties(height=260)
-                            )
-
-                            st.altair_chart(capex_bar, use_container_width=True)
-
-                            top_comp = contrib_df.sort_values("Value", ascending=False).iloc[0]
-                            st.caption(
-                                "Visual-only: each component is rescaled to 0–100 over its own history. "
-                                f"At the latest date, the relatively strongest component (within this visual scale) "
-                                f"is **{top_comp['Component']}** (~{top_comp['Value']:.1f}/100)."
-                            )
-
-
-# -----------------------------
-# INFRASTRUCTURE PILLAR DEBUG
-# -----------------------------
+    render_component_debug(
+        pillar="Capex",
+        path=os.path.join("data", "processed", "macro_capex_processed.csv"),
+        component_cols=lambda cols: [c for c in cols if c.startswith("Capex_")],
+        default_exclude=["Capex_Supply"],
+        help_text=(
+            "Includes Capex_Macro_Comp, Capex_Semi_Activity, Capex_IT_Equip, "
+            "Capex_Constr, Capex_Hyperscaler, Capex_Fab_Index, "
+            "Capex_DC_Cost_Index, Capex_Supply (composite)."
+        ),
+        baseline_note="baseline ≈ 100",
+    )
 
 with st.expander("Infra pillar debug", expanded=False):
-    st.markdown("### Infrastructure subcomponents (diagnostic view)")
-
-    infra_path = "data/processed/infra_processed.csv"
-
-    if not os.path.exists(infra_path):
-        st.warning(f"`{infra_path}` not found. Run the update-data workflow first.")
-    else:
-        try:
-            infra_df = (
-                pd.read_csv(infra_path, parse_dates=["Date"])
-                .set_index("Date")
-                .sort_index()
-            )
-        except Exception as e:
-            st.error(f"Failed to read `{infra_path}`: {e}")
-            infra_df = None
+    render_component_debug(
+        pillar="Infra",
+        path=os.path.join("data", "processed", "infra_processed.csv"),
+        component_cols=lambda cols: [
+            c for c in cols if c.startswith("Infra_") and c not in ["Infra", "Infra_Supply"]
+        ],
+        help_text="Includes Infra_Power_Grid, Infra_Construction, Infra_Semi_Equip, Infra_Materials.",
+        baseline_note="baseline ≈ 100",
+    )
 
-        if infra_df is None or infra_df.empty:
-            st.info("infra_processed.csv is empty.")
-        else:
-            infra_cols = [c for c in infra_df.columns if c.startswith("Infra_") and c not in ["Infra", "Infra_Supply"]]
-            if not infra_cols:
-                st.info("No Infra_* subcomponent columns found in infra_processed.csv.")
-            else:
-                default_selection = infra_cols
-                selected_cols = st.multiselect(
-                    "Select Infra components to display",
-                    options=infra_cols,
-                    default=default_selection,
-                    help="Includes Infra_Power_Grid, Infra_Construction, Infra_Semi_Equip, Infra_Materials.",
-                )
-
-                if not selected_cols:
-                    st.warning("Select at least one Infra component to view.")
-                else:
-                    # Raw tail for numeric sanity
-                    st.markdown("**Latest 12 months — raw Infra indices (baseline ≈ 100)**")
-                    st.dataframe(infra_df[selected_cols].tail(12))
-
-                    # Visual 0–100 normalization per component for charts
-                    vis_df = infra_df[selected_cols].copy()
-                    for col in vis_df.columns:
-                        col_min = vis_df[col].min()
-                        col_max = vis_df[col].max()
-                        if pd.isna(col_min) or pd.isna(col_max) or col_min == col_max:
-                            vis_df[col] = 50.0
-                        else:
-                            vis_df[col] = 100.0 * (vis_df[col] - col_min) / (col_max - col_min)
-
-                    vis_long = (
-                        vis_df
-                        .reset_index(names="date")
-                        .melt(id_vars="date", var_name="Component", value_name="Value")
-                    )
-
-                    infra_ts = (
-                        alt.Chart(vis_long)
-                        .mark_line()
-                        .encode(
-                            x=alt.X("date:T", title="Date"),
-                            y=alt.Y(
-                                "Value:Q",
-                                title="Visual index (0–100 per component)",
-                                scale=alt.Scale(domain=[0, 100]),
-                            ),
-                            color=alt.Color("Component:N", title="Infra Component"),
-                            tooltip=[
-                                alt.Tooltip("date:T", title="Date"),
-                                alt.Tooltip("Component:N", title="Component"),
-                                alt.Tooltip(
-                                    "Value:Q",
-                                    title="Visual index (0–100)",
-                                    format=".1f",
-                                ),
-                            ],
-                        )
-                        .properties(
-                            height=260,
-                            title="Infra components over time (visually normalized per series)",
-                        )
-                    )
-                    st.altair_chart(infra_ts, use_container_width=True)
-
-                    # Current-date visual contribution snapshot
-                    latest_idx = vis_df.dropna(how="all").index.max()
-                    if pd.isna(latest_idx):
-                        st.info("No valid recent data to compute current Infra contributions.")
-                    else:
-                        latest_vis = vis_df.loc[latest_idx, selected_cols].dropna()
-                        if latest_vis.empty:
-                            st.info("Latest row has no non-missing Infra values (visual).")
-                        else:
-                            contrib_df = (
-                                latest_vis.reset_index()
-                                .rename(columns={"index": "Component", latest_idx: "Value"})
-                            )
-                            contrib_df["Component"] = contrib_df["Component"].astype(str)
-
-                            st.markdown(
-                                f"**Current Infra contributions (visual scale)** "
-                                f"(as of `{latest_idx.date()}`, 0–100 per component)"
-                            )
-
-                            infra_bar = (
-                                alt.Chart(contrib_df)
-                                .mark_bar()
-                                .encode(
-                                    x=alt.X(
-                                        "Component:N",
-                                        title="Infra Component",
-                                        sort="-y",
-                                    ),
-                                    y=alt.Y(
-                                        "Value:Q",
-                                        title="Visual index (0–100)",
-                                        scale=alt.Scale(domain=[0, 100]),
-                                    ),
-                                    tooltip=[
-                                        alt.Tooltip("Component:N", title="Component"),
-                                        alt.Tooltip(
-                                            "Value:Q",
-                                            title="Visual index (0–100)",
-                                            format=".1f",
-                                        ),
-                                    ],
-                                )
-                                .properties(height=260)
-                            )
-
-                            st.altair_chart(infra_bar, use_container_width=True)
-
-                            top_comp = contrib_df.sort_values("Value", ascending=False).iloc[0]
-                            st.caption(
-                                "Visual-only: each Infra component is rescaled to 0–100 over its own history. "
-                                f"At the latest date, the relatively strongest component (within this visual scale) "
-                                f"is **{top_comp['Component']}** (~{top_comp['Value']:.1f}/100)."
-                            )
-
-# ----- Adoption pillar debug -----
 with st.expander("Adoption pillar debug", expanded=False):
-    st.markdown("### Adoption subcomponents (diagnostic view)")
-
-    adopt_path = "data/processed/adoption_processed.csv"
-
-    if not os.path.exists(adopt_path):
-        st.warning(f"`{adopt_path}` not found. Run the update-data workflow first.")
-    else:
-        try:
-            adopt_df = (
-                pd.read_csv(adopt_path, parse_dates=["Date"])
-                .set_index("Date")
-                .sort_index()
-            )
-        except Exception as e:
-            st.error(f"Failed to read `{adopt_path}`: {e}")
-            adopt_df = None
-
-        if adopt_df is None or adopt_df.empty:
-            st.info("adoption_processed.csv is empty.")
-        else:
-            # Only *true* subcomponents – skip the composites
-            sub_cols = [
-                c
-                for c in adopt_df.columns
-                if c.startswith("Adoption_")
-                and c not in ["Adoption", "Adoption_Supply"]
-            ]
-
-            if not sub_cols:
-                st.info(
-                    "No Adoption_* subcomponent columns found "
-                    "(excluding Adoption / Adoption_Supply)."
-                )
-            else:
-                selected_cols = st.multiselect(
-                    "Select Adoption components to display",
-                    options=sub_cols,
-                    default=sub_cols,
-                    help=(
-                        "Includes Adoption_Enterprise_Software, "
-                        "Adoption_Cloud_Services, Adoption_Digital_Labor, "
-                        "Adoption_Connectivity (when available)."
-                    ),
-                )
-
-                if not selected_cols:
-                    st.warning("Select at least one Adoption component to view.")
-                else:
-                    # Raw tail for numeric sanity
-                    st.markdown("**Latest 12 months — raw Adoption indices (2015 ≈ 100)**")
-                    st.dataframe(adopt_df[selected_cols].tail(12))
-
-                    # Visual 0–100 normalization per component (for readability)
-                    vis_df = adopt_df[selected_cols].copy()
-                    for col in vis_df.columns:
-                        col_min = vis_df[col].min()
-                        col_max = vis_df[col].max()
-                        if pd.isna(col_min) or pd.isna(col_max) or col_min == col_max:
-                            vis_df[col] = 50.0
-                        else:
-                            vis_df[col] = 100.0 * (vis_df[col] - col_min) / (col_max - col_min)
-
-                    vis_long = (
-                        vis_df.reset_index(names="date")
-                        .melt(id_vars="date", var_name="Component", value_name="Value")
-                    )
-
-                    ad_ts = (
-                        alt.Chart(vis_long)
-                        .mark_line()
-                        .encode(
-                            x=alt.X("date:T", title="Date"),
-                            y=alt.Y(
-                                "Value:Q",
-                                title="Visual index (0–100 per component)",
-                                scale=alt.Scale(domain=[0, 100]),
-                            ),
-                            color=alt.Color("Component:N", title="Adoption Component"),
-                            tooltip=[
-                                alt.Tooltip("date:T", title="Date"),
-                                alt.Tooltip("Component:N", title="Component"),
-                                alt.Tooltip(
-                                    "Value:Q",
-                                    title="Visual index (0–100)",
-                                    format=".1f",
-                                ),
-                            ],
-                        )
-                        .properties(
-                            height=260,
-                            title="Adoption components over time (visually normalized per series)",
-                        )
-                    )
-                    st.altair_chart(ad_ts, use_container_width=True)
-
-                    # Current-date visual contribution snapshot
-                    latest_idx = vis_df.dropna(how="all").index.max()
-                    if pd.isna(latest_idx):
-                        st.info(
-                            "No valid recent data to compute current Adoption contributions."
-                        )
-                    else:
-                        latest_vis = vis_df.loc[latest_idx, selected_cols].dropna()
-                        if latest_vis.empty:
-                            st.info(
-                                "Latest row has no non-missing Adoption values (visual)."
-                            )
-                        else:
-                            contrib_df = (
-                                latest_vis.reset_index()
-                                .rename(
-                                    columns={
-                                        "index": "Component",
-                                        latest_idx: "Value",
-                                    }
-                                )
-                            )
-                            contrib_df["Component"] = contrib_df["Component"].astype(str)
-
-                            st.markdown(
-                                f"**Current Adoption contributions (visual scale)** "
-                                f"(as of `{latest_idx.date()}`, 0–100 per component)"
-                            )
-
-                            ad_bar = (
-                                alt.Chart(contrib_df)
-                                .mark_bar()
-                                .encode(
-                                    x=alt.X(
-                                        "Component:N",
-                                        title="Adoption Component",
-                                        sort="-y",
-                                    ),
-                                    y=alt.Y(
-                                        "Value:Q",
-                                        title="Visual index (0–100)",
-                                        scale=alt.Scale(domain=[0, 100]),
-                                    ),
-                                    tooltip=[
-                                        alt.Tooltip("Component:N", title="Component"),
-                                        alt.Tooltip(
-                                            "Value:Q",
-                                            title="Visual index (0–100)",
-                                            format=".1f",
-                                        ),
-                                    ],
-                                )
-                                .properties(height=260)
-                            )
-
-                            st.altair_chart(ad_bar, use_container_width=True)
-
-                            top_comp = contrib_df.sort_values(
-                                "Value", ascending=False
-                            ).iloc[0]
-                            st.caption(
-                                "Visual-only: each Adoption component is rescaled to 0–100 over its own history. "
-                                f"At the latest date, the relatively strongest component (within this visual scale) "
-                                f"is **{top_comp['Component']}** (~{top_comp['Value']:.1f}/100)."
-                            )
+    # Only *true* subcomponents – skip the composites
+    render_component_debug(
+        pillar="Adoption",
+        path=os.path.join("data", "processed", "adoption_processed.csv"),
+        component_cols=lambda cols: [
+            c for c in cols if c.startswith("Adoption_") and c not in ["Adoption", "Adoption_Supply"]
+        ],
+        help_text=(
+            "Includes Adoption_Enterprise_Software, "
+            "Adoption_Cloud_Services, Adoption_Digital_Labor, "
+            "Adoption_Connectivity (when available)."
+        ),
+        baseline_note="2015 ≈ 100",
+    )
 
 
 # -----------------------------
@@ -908,7 +850,7 @@ with st.expander("Sentiment Pillar Debug"):
     else:
         st.write(f"Using file: `{sentiment_path}`")
 
-        sent = pd.read_csv(sentiment_path, index_col=0, parse_dates=True).sort_index()
+        sent = read_processed(sentiment_path)
         sent.index.name = "date"
 
         st.write("Tail of Sentiment processed data:")
@@ -920,27 +862,15 @@ with st.expander("Sentiment Pillar Debug"):
             sent_cols = sent.select_dtypes(include="number").columns.tolist()
 
         if sent_cols:
-            sent_long = (
+            sent_long = downsample_long(
                 sent[sent_cols]
                 .reset_index()
                 .melt(id_vars="date", var_name="Series", value_name="Value")
-                .dropna(subset=["Value"])
-            )
-
-            sent_chart = (
-                alt.Chart(sent_long)
-                .mark_line()
-                .encode(
-                    x=alt.X("date:T", title="Date"),
-                    y=alt.Y("Value:Q", title="Value (mixed units / indexes)"),
-                    color="Series:N",
-                    tooltip=["date:T", "Series:N", "Value:Q"],
-                )
-                .properties(height=260)
-                .interactive()
+                .dropna(subset=["Value"]),
+                series_col="Series",
             )
 
-            st.altair_chart(sent_chart, use_container_width=True)
+            show_vega_lite(series_line_spec("Value (mixed units / indexes)", ".2f"), sent_long)
         else:
             st.info("No numeric Sentiment columns to plot.")
 
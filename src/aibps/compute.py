@@ -25,6 +25,8 @@ Canonical normalization:
           window: 120
         ...
 
+Pillars whose processed file already holds a 0–100 heat score can set
+`method: passthrough` to be used as-is instead of re-normalized.
 """
 
 import os
@@ -35,26 +37,74 @@ import numpy as np
 import pandas as pd
 import yaml
 
-# Ensure we can import aibps.normalize when running as a script
 HERE = os.path.dirname(__file__)                       # .../src/aibps
-SRC_ROOT = os.path.abspath(os.path.join(HERE, ".."))   # .../src
-if SRC_ROOT not in sys.path:
-    sys.path.insert(0, SRC_ROOT)
 
-from aibps.normalize import normalize_series  # noqa: E402
+if __package__:
+    # Imported as aibps.compute (python -m aibps.compute, tests, notebooks)
+    from .normalize import normalize_series, sigmoid_z_frame
+    from .parquet_copy import current_parquet_copy, write_parquet_copy
+else:
+    # Run as a script (python src/aibps/compute.py): only then put src/ on
+    # sys.path so `aibps.normalize` resolves
+    SRC_ROOT = os.path.abspath(os.path.join(HERE, ".."))   # .../src
+    if SRC_ROOT not in sys.path:
+        sys.path.insert(0, SRC_ROOT)
+    from aibps.normalize import normalize_series, sigmoid_z_frame
+    from aibps.parquet_copy import current_parquet_copy, write_parquet_copy
 
 PROC_DIR = os.path.join("data", "processed")
 OUT_PATH = os.path.join(PROC_DIR, "aibps_monthly.csv")
 CONFIG_PATH = os.path.join(HERE, "config.yaml")
 
 
-def _read_processed(filename: str) -> pd.DataFrame | None:
+def _read_csv(path: str, date_col: str, usecols: list[str] | None = None) -> pd.DataFrame:
+    """
+    Read a CSV indexed by its first (date) column with Arrow's CSV parser.
+
+    The pyarrow engine parses in parallel and rounds floats exactly (like
+    float_precision="round_trip"); it needs the date column named explicitly.
+    Falls back to pandas' C engine when pyarrow is not installed.
+    """
+    try:
+        return pd.read_csv(path, index_col=0, parse_dates=[date_col], usecols=usecols, engine="pyarrow")
+    except ImportError:
+        return pd.read_csv(path, index_col=0, parse_dates=True, usecols=usecols)
+
+
+def _read_processed(filename: str, columns: list[str] | None = None) -> pd.DataFrame | None:
+    """
+    Read a processed CSV (first column = date index), sorted by date.
+
+    A Parquet sibling (same name, .parquet) written by the fetch scripts is
+    used instead when it was written from the CSV's current contents (see
+    parquet_copy.current_parquet_copy).
+
+    If `columns` is given, only those (when present) are parsed alongside the
+    date index, so wide per-pillar files don't pay for subcomponent columns
+    the composite never uses. When none of them exist, the first data column
+    is kept so callers can still fall back to it.
+    """
     path = os.path.join(PROC_DIR, filename)
     if not os.path.exists(path):
         print(f"ℹ️ {filename} missing.")
         return None
     try:
-        df = pd.read_csv(path, index_col=0, parse_dates=True).sort_index()
+        pq_path = current_parquet_copy(path)
+        if pq_path is not None:
+            # Typed Parquet copy written alongside the CSV: no text/date parsing
+            df = pd.read_parquet(pq_path, engine="pyarrow")
+            if columns is not None:
+                keep = [c for c in df.columns if c in columns] or list(df.columns[:1])
+                df = df[keep]
+            df = df.sort_index()
+        else:
+            header = list(pd.read_csv(path, nrows=0).columns)
+            usecols = None
+            if columns is not None:
+                usecols = [header[0]] + [c for c in header[1:] if c in columns]
+                if len(usecols) == 1:
+                    usecols = header[:2]
+            df = _read_csv(path, header[0], usecols).sort_index()
         if df.empty:
             print(f"ℹ️ {filename} exists but is empty.")
             return None
@@ -94,18 +144,77 @@ def _load_norm_config():
     return defaults, pillar_cfg
 
 
+def _align_to_index(series: pd.Series, idx: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Exact-date alignment of a sorted, unique-dated Series onto `idx` (NaN where absent).
+
+    Same result as `series.reindex(idx).to_numpy()`, but both sides are
+    already sorted, so a binary search over the int64 timestamps replaces
+    pandas' hash-based index alignment.
+    """
+    out = np.full(len(idx), np.nan)
+    if series.empty:
+        return out
+    if not (series.index.is_monotonic_increasing and series.index.is_unique):
+        return series.reindex(idx).to_numpy(dtype=np.float64)
+
+    src = np.asarray(series.index, dtype="datetime64[ns]").view(np.int64)
+    tgt = np.asarray(idx, dtype="datetime64[ns]").view(np.int64)
+    pos = np.minimum(np.searchsorted(src, tgt), len(src) - 1)
+    hit = src[pos] == tgt
+    out[hit] = series.to_numpy(dtype=np.float64)[pos[hit]]
+    return out
+
+
+def _nanmean_rows(values: np.ndarray) -> np.ndarray:
+    """
+    Row-wise mean over non-missing entries of a 2-D float array (NaN if none).
+
+    Same as DataFrame.mean(axis=1, skipna=True) on the underlying block, but a
+    single sum/count pass in NumPy without the "mean of empty slice" warning.
+    """
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=1)
+    sums = np.where(valid, values, 0.0).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def _trailing_mean(values: pd.Series, window: int = 3) -> pd.Series:
+    """
+    NaN-aware trailing mean, equivalent to rolling(window, min_periods=1).mean().
+
+    Uses cumulative sums of the values and of the valid-observation mask, so
+    the whole window is two vector subtractions instead of pandas' Rolling
+    machinery. Rows whose window holds no valid observation come out NaN.
+    """
+    x = values.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(x)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, x, 0.0))))
+    ccnt = np.concatenate(([0], np.cumsum(valid)))
+
+    ends = np.arange(1, len(x) + 1)
+    starts = np.maximum(ends - window, 0)
+    counts = ccnt[ends] - ccnt[starts]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = (csum[ends] - csum[starts]) / counts
+    out[counts == 0] = np.nan
+    return pd.Series(out, index=values.index, name=values.name)
+
+
 def main():
     t0 = time.time()
 
     # ---- Load pillar inputs ----
-    market = _read_processed("market_processed.csv")
-    credit = _read_processed("credit_fred_processed.csv")
-    capex = _read_processed("capex_processed.csv")
-    macro_capex = _read_processed("macro_capex_processed.csv")
-    infra = _read_processed("infra_processed.csv")
-    infra_macro = _read_processed("infra_macro_processed.csv")
-    adoption = _read_processed("adoption_processed.csv")
-    sentiment = _read_processed("sentiment_processed.csv")
+    # Only the pillar-level columns are parsed; subcomponents stay on disk
+    market = _read_processed("market_processed.csv", ["Market"])
+    credit = _read_processed("credit_fred_processed.csv", ["Credit"])
+    capex = _read_processed("capex_processed.csv", ["Capex_Supply", "Capex_Supply_Manual"])
+    macro_capex = _read_processed("macro_capex_processed.csv", ["Capex_Supply_Macro"])
+    infra = _read_processed("infra_processed.csv", ["Infra", "Infra_Manual"])
+    infra_macro = _read_processed("infra_macro_processed.csv", ["Infra_Macro"])
+    adoption = _read_processed("adoption_processed.csv", ["Adoption"])
+    sentiment = _read_processed("sentiment_processed.csv", ["Sentiment"])
 
     frames = [x for x in [market, credit, capex, macro_capex, infra, infra_macro, adoption, sentiment] if x is not None]
     if not frames:
@@ -115,71 +224,92 @@ def main():
     # Build a monthly date index covering all available data
     start = min(df.index.min() for df in frames)
     end = max(df.index.max() for df in frames)
+    # (MonthEnd(0) rolls to the month end without a Period round-trip)
     idx = pd.date_range(
-        start=start.to_period("M").to_timestamp("M"),
-        end=end.to_period("M").to_timestamp("M"),
-        freq="M",
+        start=start.normalize() + pd.offsets.MonthEnd(0),
+        end=end.normalize() + pd.offsets.MonthEnd(0),
+        freq="ME",
     )
-    base = pd.DataFrame(index=idx)
-    base.index.name = "date"
 
-    # ---- Attach "raw-ish" pillar series ----
+    # ---- Collect "raw-ish" pillar series ----
+    # Gathered first and aligned to the shared monthly grid in one pass below
+    raw = {}
 
     # Market
     if market is not None:
         col = "Market" if "Market" in market.columns else market.columns[0]
-        base["Market_raw"] = market[col].reindex(base.index)
+        raw["Market_raw"] = market[col]
 
     # Credit
     if credit is not None:
         col = "Credit" if "Credit" in credit.columns else credit.columns[0]
-        base["Credit_raw"] = credit[col].reindex(base.index)
+        raw["Credit_raw"] = credit[col]
 
     # Capex (manual)
     if capex is not None:
         if "Capex_Supply" in capex.columns:
-            base["Capex_Supply_Manual_raw"] = capex["Capex_Supply"].reindex(base.index)
+            raw["Capex_Supply_Manual_raw"] = capex["Capex_Supply"]
         elif "Capex_Supply_Manual" in capex.columns:
-            base["Capex_Supply_Manual_raw"] = capex["Capex_Supply_Manual"].reindex(base.index)
+            raw["Capex_Supply_Manual_raw"] = capex["Capex_Supply_Manual"]
 
     # Capex (macro)
     if macro_capex is not None:
         if "Capex_Supply_Macro" in macro_capex.columns:
-            base["Capex_Supply_Macro_raw"] = macro_capex["Capex_Supply_Macro"].reindex(base.index)
+            raw["Capex_Supply_Macro_raw"] = macro_capex["Capex_Supply_Macro"]
 
     # Infra (manual)
     if infra is not None:
         if "Infra" in infra.columns:
-            base["Infra_Manual_raw"] = infra["Infra"].reindex(base.index)
+            raw["Infra_Manual_raw"] = infra["Infra"]
         elif "Infra_Manual" in infra.columns:
-            base["Infra_Manual_raw"] = infra["Infra_Manual"].reindex(base.index)
+            raw["Infra_Manual_raw"] = infra["Infra_Manual"]
 
     # Infra (macro)
     if infra_macro is not None:
         if "Infra_Macro" in infra_macro.columns:
-            base["Infra_Macro_raw"] = infra_macro["Infra_Macro"].reindex(base.index)
+            raw["Infra_Macro_raw"] = infra_macro["Infra_Macro"]
 
     # Adoption
     if adoption is not None:
         if "Adoption" in adoption.columns:
-            base["Adoption_raw"] = adoption["Adoption"].reindex(base.index)
+            raw["Adoption_raw"] = adoption["Adoption"]
 
     # Sentiment
     if sentiment is not None:
         if "Sentiment" in sentiment.columns:
-            base["Sentiment_raw"] = sentiment["Sentiment"].reindex(base.index)
+            raw["Sentiment_raw"] = sentiment["Sentiment"]
+
+    # ---- Column layout ----
+    # Every output column is known up front, so `base` is built once from a
+    # single preallocated float64 matrix filled by column index, rather than
+    # growing a DataFrame one inserted column at a time.
+    raw_cols = list(raw)
 
-    # ---- Combine manual/macro where relevant ----
+    # Capex / Infra = mean of manual + macro where both exist
+    combos = {
+        "Capex_Supply_raw": [c for c in ["Capex_Supply_Manual_raw", "Capex_Supply_Macro_raw"] if c in raw],
+        "Infra_raw": [c for c in ["Infra_Manual_raw", "Infra_Macro_raw"] if c in raw],
+    }
+    combined_cols = [c for c, sources in combos.items() if sources]
+
+    canonical_pillars = ["Market", "Credit", "Capex_Supply", "Infra", "Adoption", "Sentiment"]
+    have_raw = set(raw_cols) | set(combined_cols)
+    pillar_cols = [p for p in canonical_pillars if f"{p}_raw" in have_raw]
 
-    # Capex_Supply = mean of manual + macro where both exist
-    if ("Capex_Supply_Manual_raw" in base.columns) or ("Capex_Supply_Macro_raw" in base.columns):
-        cols = [c for c in ["Capex_Supply_Manual_raw", "Capex_Supply_Macro_raw"] if c in base.columns]
-        base["Capex_Supply_raw"] = base[cols].mean(axis=1, skipna=True)
+    cols = raw_cols + combined_cols + pillar_cols + ["AIBPS", "AIBPS_RA"]
+    col_ix = {c: j for j, c in enumerate(cols)}
+    mat = np.full((len(idx), len(cols)), np.nan, dtype=np.float64)
 
-    # Infra = mean of manual + macro where both exist
-    if ("Infra_Manual_raw" in base.columns) or ("Infra_Macro_raw" in base.columns):
-        cols = [c for c in ["Infra_Manual_raw", "Infra_Macro_raw"] if c in base.columns]
-        base["Infra_raw"] = base[cols].mean(axis=1, skipna=True)
+    if raw:
+        mat[:, : len(raw_cols)] = np.column_stack([_align_to_index(s, idx) for s in raw.values()])
+
+    for name in combined_cols:
+        sources = [col_ix[c] for c in combos[name]]
+        mat[:, col_ix[name]] = _nanmean_rows(mat[:, sources])
+
+    def column(name: str) -> pd.Series:
+        """View one matrix column as a date-indexed Series."""
+        return pd.Series(mat[:, col_ix[name]], index=idx, name=name)
 
     # ---- Normalization config ----
 
@@ -204,56 +334,59 @@ def main():
             kwargs["z_clip"] = 4.0
         return method, kwargs
 
-    canonical_pillars = ["Market", "Credit", "Capex_Supply", "Infra", "Adoption", "Sentiment"]
-    normalized_pillars = []
+    normalized = {}
+
+    # rolling_z_sigmoid pillars that share (window, min_periods, z_clip) are
+    # normalized together in one 2-D pass; other methods go column by column.
+    sigmoid_groups = {}
 
     for name in canonical_pillars:
         raw_col = f"{name}_raw"
-        if raw_col not in base.columns:
+        if raw_col not in col_ix:
             print(f"ℹ️ No raw series for {name}; skipping.")
             continue
 
         method, kwargs = get_norm_params(name)
         print(f"🔧 Normalizing {name} with method={method}, params={kwargs}")
 
+        if str(method).lower() == "rolling_z_sigmoid":
+            key = (int(kwargs["window"]), kwargs.get("min_periods"), float(kwargs["z_clip"]))
+            sigmoid_groups.setdefault(key, []).append(name)
+            continue
+
         try:
-            norm_series = normalize_series(base[raw_col], method=method, **kwargs)
+            normalized[name] = normalize_series(column(raw_col), method=method, **kwargs)
         except Exception as e:
             print(f"❌ Normalization failed for {name}: {e}")
-            continue
-
-        base[name] = norm_series
-        normalized_pillars.append(name)
-
-    if not normalized_pillars:
-        print("❌ No pillars normalized; cannot compute AIBPS.")
-        sys.exit(1)
 
-    # ---- Harmonize pillars (Capex & Infra) ----
-    # We may have manual + macro components; combine to single pillar when possible.
-
-    # Capex: combine manual + macro into Capex_Supply if needed
-    if "Capex_Supply" not in base.columns:
-        capex_sources = [c for c in ["Capex_Supply_Manual", "Capex_Supply_Macro"] if c in base.columns]
-        if capex_sources:
-            base["Capex_Supply"] = base[capex_sources].mean(axis=1, skipna=True)
+    for (window, min_periods, z_clip), names in sigmoid_groups.items():
+        raw_names = [f"{n}_raw" for n in names]
+        try:
+            block = sigmoid_z_frame(
+                pd.DataFrame(mat[:, [col_ix[c] for c in raw_names]], index=idx, columns=raw_names),
+                window=window,
+                min_periods=min_periods,
+                z_clip=z_clip,
+            )
+        except Exception as e:
+            print(f"❌ Normalization failed for {', '.join(names)}: {e}")
+            continue
+        for n in names:
+            normalized[n] = block[f"{n}_raw"]
 
-    # Infra: combine manual + macro into Infra if needed
-    if "Infra" not in base.columns:
-        infra_sources = [c for c in ["Infra_Manual", "Infra_Macro"] if c in base.columns]
-        if infra_sources:
-            base["Infra"] = base[infra_sources].mean(axis=1, skipna=True)
+    for name, series in normalized.items():
+        mat[:, col_ix[name]] = series.to_numpy(dtype=np.float64)
 
     # ---- Pick the normalized pillars that actually exist ----
     # (These are the columns we will use for the composite AIBPS)
-    candidate_pillars = ["Market", "Credit", "Capex_Supply", "Infra", "Adoption", "Sentiment"]
-    normalized_pillars = [c for c in candidate_pillars if c in base.columns]
+    normalized_pillars = [c for c in pillar_cols if c in normalized]
 
     print("---- Pillars used in composite ----")
     print(normalized_pillars)
 
     if not normalized_pillars:
-        raise RuntimeError("No normalized pillars available to compute AIBPS.")
+        print("❌ No pillars normalized; cannot compute AIBPS.")
+        sys.exit(1)
 
     # ---- Compute AIBPS composite (equal-weight across available pillars) ----
     w = np.ones(len(normalized_pillars), dtype=float)
@@ -263,32 +396,29 @@ def main():
     print("---- Weights ----")
     print(weights)
 
-    vals = base[normalized_pillars]
-
-    # Build a weight matrix aligned to vals
-    weight_vec = weights.reindex(normalized_pillars)
-    weight_matrix = pd.DataFrame(
-        np.broadcast_to(weight_vec.values, (len(vals), len(weight_vec))),
-        index=vals.index,
-        columns=normalized_pillars,
-    )
+    vals = mat[:, [col_ix[c] for c in normalized_pillars]]
+    valid = ~np.isnan(vals)
+    weight_vec = weights.reindex(normalized_pillars).to_numpy()
 
     # Only count weights where we actually have data
-    effective_weights = weight_matrix.where(vals.notna())
-    weighted_vals = vals * effective_weights
-
-    weighted_sum = weighted_vals.sum(axis=1, skipna=True)
-    total_w = effective_weights.sum(axis=1)
+    weighted_sum = np.where(valid, vals, 0.0) @ weight_vec
+    total_w = valid @ weight_vec
 
-    composite = weighted_sum / total_w
+    with np.errstate(invalid="ignore", divide="ignore"):
+        composite = weighted_sum / total_w
     composite[total_w == 0] = np.nan  # if no pillars, mark as NaN
 
     # Require at least 2 pillars to define AIBPS
-    num_pillars_available = vals.notna().sum(axis=1)
+    num_pillars_available = valid.sum(axis=1)
     composite[num_pillars_available < 2] = np.nan
 
-    base["AIBPS"] = composite
-    base["AIBPS_RA"] = base["AIBPS"].rolling(3, min_periods=1).mean()
+    mat[:, col_ix["AIBPS"]] = composite
+    mat[:, col_ix["AIBPS_RA"]] = _trailing_mean(column("AIBPS"), window=3).to_numpy()
+
+    # Wrap once; pillars whose normalization failed are left out
+    keep = [c for c in cols if c not in pillar_cols or c in normalized]
+    base = pd.DataFrame(mat[:, [col_ix[c] for c in keep]], index=idx, columns=keep)
+    base.index.name = "date"
 
     # Drop rows where composite is NaN
     out = base.dropna(subset=["AIBPS"], how="all")
@@ -313,6 +443,8 @@ def main():
     out.to_csv(OUT_PATH)
     print(f"💾 Wrote {OUT_PATH} with pillars: {normalized_pillars} (rows={len(out)})")
 
+    write_parquet_copy(out, OUT_PATH)
+
 
 if __name__ == "__main__":
     try:
@@ -40,7 +40,40 @@ Output:
 import os
 import sys
 
-import pandas as pd
+OUT_PATH = "data/processed/adoption_processed.csv"
+
+# Columns of the processed file (also used for the empty shell file)
+OUTPUT_COLUMNS = [
+    "Adoption_Enterprise_Software",
+    "Adoption_Cloud_Services",
+    "Adoption_Digital_Labor",
+    "Adoption_Connectivity",
+    "Adoption_Supply",
+    "Adoption",
+]
+
+if __package__:
+    from .parquet_copy import remove_parquet_copy, write_parquet_copy
+else:
+    from parquet_copy import remove_parquet_copy, write_parquet_copy
+
+if __name__ == "__main__" and not os.getenv("FRED_API_KEY"):
+    # Fast path: nothing can be fetched without a key, so write the empty
+    # shell file before paying for the pandas / fredapi imports.
+    print("⚠️ FRED_API_KEY not set; cannot fetch Adoption data from FRED.")
+    os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
+    with open(OUT_PATH, "w") as f:
+        f.write(",".join(["Date"] + OUTPUT_COLUMNS) + "\n")
+    remove_parquet_copy(OUT_PATH)
+    print(f"💾 Wrote empty {OUT_PATH} (no FRED client).")
+    sys.exit(0)
+
+import pandas as pd  # noqa: E402
+
+if __package__:
+    from .fred_cache import get_series_concurrently
+else:
+    from fred_cache import get_series_concurrently
 
 # fredapi is required for this script
 try:
@@ -53,7 +86,6 @@ except ImportError:
 # ---------------------------------------------------------------------
 
 START_DATE = "1980-01-31"
-OUT_PATH = "data/processed/adoption_processed.csv"
 
 # 1) Enterprise software / IP investment
 ENTERPRISE_SERIES = [
@@ -116,9 +148,11 @@ def fetch_series_block(fred, pairs, label):
     """
     frames = []
 
+    futures = get_series_concurrently(fred, [sid for sid, _ in pairs])
+
     for sid, colname in pairs:
         try:
-            ser = fred.get_series(sid)
+            ser = futures[sid].result()
             if ser is None or len(ser) == 0:
                 print(f"⚠️ Block={label}: empty or missing series {sid} ({colname}); skipping.")
                 continue
@@ -167,9 +201,13 @@ def reindex_monthly(df, start_date):
     if df is None or df.empty:
         return pd.DataFrame()
 
-    df = df.copy()
-    df.index = pd.to_datetime(df.index, errors="coerce")
-    df = df[~df.index.isna()].sort_index()
+    # One masked copy (no defensive full copy first); the caller's frame
+    # is left untouched because the index is set on the masked result
+    idx = pd.to_datetime(df.index, errors="coerce")
+    keep = ~idx.isna()
+    df = df[keep]
+    df.index = idx[keep]
+    df = df.sort_index()
 
     if df.empty:
         return pd.DataFrame()
@@ -193,15 +231,8 @@ def main():
     if fred is None:
         # Write an empty shell file so downstream steps don't blow up.
         os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
-        empty_cols = [
-            "Adoption_Enterprise_Software",
-            "Adoption_Cloud_Services",
-            "Adoption_Digital_Labor",
-            "Adoption_Connectivity",
-            "Adoption_Supply",
-            "Adoption",
-        ]
-        pd.DataFrame(columns=empty_cols).to_csv(OUT_PATH, index_label="Date")
+        pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(OUT_PATH, index_label="Date")
+        remove_parquet_copy(OUT_PATH)
         print(f"💾 Wrote empty {OUT_PATH} (no FRED client).")
         return 0
 
@@ -226,15 +257,8 @@ def main():
     if combined.empty:
         print("⚠️ All Adoption sub-blocks empty; writing empty adoption_processed.csv.")
         os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
-        empty_cols = [
-            "Adoption_Enterprise_Software",
-            "Adoption_Cloud_Services",
-            "Adoption_Digital_Labor",
-            "Adoption_Connectivity",
-            "Adoption_Supply",
-            "Adoption",
-        ]
-        pd.DataFrame(columns=empty_cols).to_csv(OUT_PATH, index_label="Date")
+        pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(OUT_PATH, index_label="Date")
+        remove_parquet_copy(OUT_PATH)
         print(f"💾 Wrote empty {OUT_PATH}")
         return 0
 
@@ -269,6 +293,9 @@ def main():
     # ---- Write output ----
     os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
     combined_m.to_csv(OUT_PATH, index_label="Date")
+
+    write_parquet_copy(combined_m, OUT_PATH)
+
     print(
         f"💾 Wrote {OUT_PATH} with {len(combined_m)} rows and columns: "
         f"{list(combined_m.columns)}"
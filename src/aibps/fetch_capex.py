@@ -4,9 +4,17 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-import numpy as np
 import pandas as pd
 
+if __package__:
+    from .fred_cache import get_series_concurrently
+    from .monthly import rebase_100, to_monthly
+    from .parquet_copy import write_parquet_copy
+else:
+    from fred_cache import get_series_concurrently
+    from monthly import rebase_100, to_monthly
+    from parquet_copy import write_parquet_copy
+
 
 DATA_DIR = Path("data")
 PROC_OUT = DATA_DIR / "processed" / "capex_processed.csv"
@@ -28,31 +36,6 @@ SEMICON_IP = "IPB53800"            # Industrial production: semiconductors
 SEMICON_CAPUTIL = "CAPUTLB50001SQ" # Capacity utilization: Semiconductor fab
 
 
-def _to_monthly(s: pd.Series) -> pd.Series:
-    """
-    Convert a FRED series (annual, quarterly, or monthly) to end-of-month
-    monthly frequency via forward fill, starting at START.
-    """
-    s = pd.Series(s).sort_index()
-    s.index = pd.to_datetime(s.index)
-    s.index.name = "date"
-    s = s.resample("M").ffill()
-    s = s[s.index >= pd.to_datetime(START)]
-    return s
-
-
-def _rebase_100(s: pd.Series) -> pd.Series:
-    """
-    Rebase a series so that its first non-NaN value = 100.
-    """
-    if not s.notna().any():
-        return s * np.nan
-    first = s.dropna().iloc[0]
-    if not np.isfinite(first) or first == 0:
-        return s * np.nan
-    return (s / first) * 100.0
-
-
 def main():
     key = os.getenv("FRED_API_KEY")
     if not key:
@@ -72,12 +55,12 @@ def main():
         "Capex_Semicon_CapUtil": SEMICON_CAPUTIL,
     }
 
+    futures = get_series_concurrently(fred, series_map.values(), observation_start=START)
+
     frames = {}
     for label, sid in series_map.items():
         try:
-            raw = fred.get_series(sid, observation_start=START)
-            monthly = _to_monthly(raw)
-            frames[label] = monthly
+            frames[label] = futures[sid].result()
         except Exception as e:
             print(f"⚠️ Failed to fetch {sid} ({label}): {e}")
 
@@ -86,12 +69,10 @@ def main():
         return
 
     # Combine to wide DataFrame
-    df = pd.concat(frames.values(), axis=1)
-    df.columns = list(frames.keys())
-    df.index.name = "date"
+    df = to_monthly(frames, START)
 
     # Rebase each component to 100
-    rebased = df.apply(_rebase_100)
+    rebased = rebase_100(df)
     rebased_cols = [f"{c}_idx" for c in rebased.columns]
     rebased.columns = rebased_cols
 
@@ -105,6 +86,8 @@ def main():
     PROC_OUT.parent.mkdir(parents=True, exist_ok=True)
     out.to_csv(PROC_OUT)
 
+    write_parquet_copy(out, PROC_OUT)
+
     print("---- Capex composite tail ----")
     print(out[["Capex_Supply"]].tail(6))
     print(f"💾 Wrote {PROC_OUT} with columns: {list(out.columns)}")
@@ -7,6 +7,11 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+if __package__:
+    from .parquet_copy import write_parquet_copy
+else:
+    from parquet_copy import write_parquet_copy
+
 
 DATA_DIR = Path("data")
 PROC_OUT = DATA_DIR / "processed" / "credit_fred_processed.csv"
@@ -23,7 +28,7 @@ def _to_monthly(s: pd.Series) -> pd.Series:
     s = s.sort_index()
     s.index = pd.to_datetime(s.index)
     s.index.name = "date"
-    return s.resample("M").last()
+    return s.resample("ME").last()
 
 
 def main():
@@ -69,6 +74,8 @@ def main():
     PROC_OUT.parent.mkdir(parents=True, exist_ok=True)
     df.to_csv(PROC_OUT)
 
+    write_parquet_copy(df, PROC_OUT)
+
     print("---- credit_fred_processed tail ----")
     print(df.tail(6))
     print(
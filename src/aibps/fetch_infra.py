@@ -33,6 +33,15 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+if __package__:
+    from .fred_cache import get_series_concurrently
+    from .monthly import stack_monthly
+    from .parquet_copy import remove_parquet_copy, write_parquet_copy
+else:
+    from fred_cache import get_series_concurrently
+    from monthly import stack_monthly
+    from parquet_copy import remove_parquet_copy, write_parquet_copy
+
 PROC_DIR = Path("data") / "processed"
 OUT_PATH = PROC_DIR / "infra_processed.csv"
 
@@ -105,32 +114,30 @@ def fetch_fred_block(fred, series_map, label: str) -> pd.DataFrame | None:
         print(f"ℹ️ No FRED client; skipping {label} block.")
         return None
 
-    frames = []
+    futures = get_series_concurrently(fred, series_map)
+
+    raw = {}
     for sid, col_name in series_map.items():
         try:
-            ser = fred.get_series(sid)
+            ser = futures[sid].result()
             if ser is None or len(ser) == 0:
                 print(f"⚠️ FRED returned empty for {sid} ({col_name}); skipping.")
                 continue
-            df = ser.to_frame(name=col_name)
-            df.index = pd.to_datetime(df.index)
-            df = df.sort_index()
-            df_m = df.resample("M").ffill()
-            frames.append(df_m)
+            ser = pd.Series(ser.to_numpy(), index=pd.to_datetime(ser.index), name=col_name).sort_index()
+            raw[col_name] = ser
+            first, last = ser.index[[0, -1]].normalize() + pd.offsets.MonthEnd(0)
             print(
                 f"✅ FRED {sid} → {col_name} [{label}]: "
-                f"{df_m.index.min().date()} to {df_m.index.max().date()}"
+                f"{first.date()} to {last.date()}"
             )
         except Exception as e:
             print(f"⚠️ Failed to fetch {sid} ({col_name}) [{label}]: {e}")
 
-    if not frames:
+    if not raw:
         print(f"⚠️ No series fetched for {label} block.")
         return None
 
-    combined = pd.concat(frames, axis=1).sort_index()
-    combined = combined.dropna(how="all")
-    return combined
+    return stack_monthly(raw)
 
 
 def scale_to_index(series: pd.Series, baseline_date: pd.Timestamp, name: str) -> pd.Series:
@@ -218,13 +225,14 @@ def main():
             "Infra_Materials", "Infra_Supply", "Infra"
         ])
         df.to_csv(OUT_PATH, index_label="Date")
+        remove_parquet_copy(OUT_PATH)
         print(f"💾 Wrote empty {OUT_PATH}")
         return 0
 
     # Build a unified index from the earliest to latest of all series
     idx_min = min(s.index.min() for s in non_empty)
     idx_max = max(s.index.max() for s in non_empty)
-    monthly_idx = pd.date_range(idx_min, idx_max, freq="M")
+    monthly_idx = pd.date_range(idx_min, idx_max, freq="ME")
 
     df = pd.DataFrame(index=monthly_idx)
 
@@ -260,6 +268,9 @@ def main():
     print(df.tail(10))
 
     df.to_csv(OUT_PATH, index_label="Date")
+
+    write_parquet_copy(df, OUT_PATH)
+
     print(f"💾 Wrote {OUT_PATH} with columns: {list(df.columns)} (rows={len(df)})")
     return 0
 
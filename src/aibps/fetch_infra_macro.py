@@ -4,9 +4,17 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-import numpy as np
 import pandas as pd
 
+if __package__:
+    from .fred_cache import get_series_concurrently
+    from .monthly import rebase_100, to_monthly
+    from .parquet_copy import write_parquet_copy
+else:
+    from fred_cache import get_series_concurrently
+    from monthly import rebase_100, to_monthly
+    from parquet_copy import write_parquet_copy
+
 
 DATA_DIR = Path("data")
 PROC_OUT = DATA_DIR / "processed" / "infra_macro_processed.csv"
@@ -21,31 +29,6 @@ INFRA_SERIES = {
 }
 
 
-def _to_monthly(s: pd.Series) -> pd.Series:
-    """
-    Take a FRED series (annual, quarterly, or monthly) and convert to
-    end-of-month monthly frequency via forward-fill.
-    """
-    s = pd.Series(s).sort_index()
-    s.index = pd.to_datetime(s.index)
-    s.index.name = "date"
-    # Resample to monthly and forward-fill
-    s = s.resample("M").ffill()
-    # Trim to START
-    s = s[s.index >= pd.to_datetime(START)]
-    return s
-
-
-def _rebase_100(s: pd.Series) -> pd.Series:
-    """Rebase series so first non-NaN value = 100."""
-    if not s.notna().any():
-        return s * np.nan
-    first = s.dropna().iloc[0]
-    if not np.isfinite(first) or first == 0:
-        return s * np.nan
-    return (s / first) * 100.0
-
-
 def main():
     key = os.getenv("FRED_API_KEY")
     if not key:
@@ -55,12 +38,12 @@ def main():
     from fredapi import Fred
     fred = Fred(api_key=key)
 
+    futures = get_series_concurrently(fred, INFRA_SERIES.values(), observation_start=START)
+
     frames = {}
     for label, sid in INFRA_SERIES.items():
         try:
-            raw = fred.get_series(sid, observation_start=START)
-            monthly = _to_monthly(raw)
-            frames[label] = monthly
+            frames[label] = futures[sid].result()
         except Exception as e:
             print(f"⚠️ Failed to fetch {sid} ({label}): {e}")
 
@@ -68,12 +51,11 @@ def main():
         print("❌ No Infra series fetched; not writing file.")
         return
 
-    df = pd.concat(frames.values(), axis=1)
-    df.columns = list(frames.keys())
-    df.index.name = "date"
+    # Combine to wide DataFrame
+    df = to_monthly(frames, START)
 
     # Rebase each component to 100
-    rebased = df.apply(_rebase_100)
+    rebased = rebase_100(df)
     rebased_cols = [f"{c}_idx" for c in rebased.columns]
     rebased.columns = rebased_cols
 
@@ -86,6 +68,8 @@ def main():
     PROC_OUT.parent.mkdir(parents=True, exist_ok=True)
     out.to_csv(PROC_OUT)
 
+    write_parquet_copy(out, PROC_OUT)
+
     print("---- Infra macro composite tail ----")
     print(out[["Infra"]].tail(6))
     print(f"💾 Wrote {PROC_OUT} with columns: {list(out.columns)}")
@@ -51,6 +51,15 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+if __package__:
+    from .fred_cache import get_series_concurrently
+    from .monthly import stack_monthly
+    from .parquet_copy import write_parquet_copy
+else:
+    from fred_cache import get_series_concurrently
+    from monthly import stack_monthly
+    from parquet_copy import write_parquet_copy
+
 PROC_DIR = Path("data") / "processed"
 RAW_DIR = Path("data") / "raw"
 OUT_PATH = PROC_DIR / "macro_capex_processed.csv"
@@ -113,29 +122,27 @@ def fetch_fred_block(fred, series_map, label: str) -> pd.DataFrame | None:
         print(f"ℹ️ No FRED client; skipping {label} block.")
         return None
 
-    frames = []
+    futures = get_series_concurrently(fred, series_map)
+
+    raw = {}
     for sid, col_name in series_map.items():
         try:
-            ser = fred.get_series(sid)
+            ser = futures[sid].result()
             if ser is None or len(ser) == 0:
                 print(f"⚠️ FRED returned empty for {sid} ({col_name}); skipping.")
                 continue
-            df = ser.to_frame(name=col_name)
-            df.index = pd.to_datetime(df.index)
-            df = df.sort_index()
-            df_m = df.resample("M").ffill()
-            frames.append(df_m)
-            print(f"✅ FRED {sid} → {col_name} [{label}]: {df_m.index.min().date()} to {df_m.index.max().date()}")
+            ser = pd.Series(ser.to_numpy(), index=pd.to_datetime(ser.index), name=col_name).sort_index()
+            raw[col_name] = ser
+            first, last = ser.index[[0, -1]].normalize() + pd.offsets.MonthEnd(0)
+            print(f"✅ FRED {sid} → {col_name} [{label}]: {first.date()} to {last.date()}")
         except Exception as e:
             print(f"⚠️ Failed to fetch {sid} ({col_name}) [{label}]: {e}")
 
-    if not frames:
+    if not raw:
         print(f"⚠️ No series fetched for {label} block.")
         return None
 
-    combined = pd.concat(frames, axis=1).sort_index()
-    combined = combined.dropna(how="all")
-    return combined
+    return stack_monthly(raw)
 
 
 def scale_to_index(series: pd.Series, baseline_date: pd.Timestamp, name: str) -> pd.Series:
@@ -177,6 +184,39 @@ def build_macro_block_index(df: pd.DataFrame, name: str) -> pd.Series:
     return idx
 
 
+def sum_by_date(dates: pd.Series, values: pd.DataFrame, name: str) -> pd.Series:
+    """
+    Sum provider columns into one total per date.
+
+    Rows are sorted once and rows sharing a date are collapsed with
+    np.add.reduceat over the run boundaries, so duplicate dates add up
+    instead of breaking the later monthly reindex. Rows without a date
+    (NaT) are dropped, as groupby would, so the index stays monotonic.
+    """
+    has_date = dates.notna().to_numpy()
+    d = dates.to_numpy()[has_date]
+    order = np.argsort(d, kind="stable")
+    d = d[order]
+    row_tot = np.nansum(values.to_numpy(dtype=float)[has_date][order], axis=1)
+
+    starts = np.concatenate(([0], np.flatnonzero(d[1:] != d[:-1]) + 1))
+    sums = np.add.reduceat(row_tot, starts)
+    return pd.Series(sums, index=pd.DatetimeIndex(d[starts]), name=name)
+
+
+def _read_raw_csv(path: Path) -> pd.DataFrame:
+    """Read a raw input CSV with Arrow's multithreaded parser (C engine without pyarrow)."""
+    try:
+        return pd.read_csv(path, engine="pyarrow")
+    except ImportError:
+        return pd.read_csv(path)
+
+
+def _year_end(years: pd.Series) -> pd.Series:
+    """Dec-31 timestamps for integer years, without building date strings."""
+    return pd.to_datetime(years.astype("int64"), format="%Y") + pd.offsets.YearEnd(0)
+
+
 def load_hyperscaler_capex() -> pd.Series | None:
     """Load hyperscaler capex from data/raw/hyperscaler_capex.csv."""
     csv_path = RAW_DIR / "hyperscaler_capex.csv"
@@ -185,7 +225,7 @@ def load_hyperscaler_capex() -> pd.Series | None:
         return None
 
     try:
-        df = pd.read_csv(csv_path)
+        df = _read_raw_csv(csv_path)
     except Exception as e:
         print(f"⚠️ Failed to read {csv_path}: {e}")
         return None
@@ -198,7 +238,7 @@ def load_hyperscaler_capex() -> pd.Series | None:
             return None
     elif "Year" in df.columns:
         try:
-            df["date"] = pd.to_datetime(df["Year"].astype(str) + "-12-31")
+            df["date"] = _year_end(df["Year"])
         except Exception as e:
             print(f"⚠️ Failed to convert 'Year' to dates in hyperscaler_capex.csv: {e}")
             return None
@@ -206,8 +246,6 @@ def load_hyperscaler_capex() -> pd.Series | None:
         print("⚠️ hyperscaler_capex.csv must contain 'date' or 'Year'.")
         return None
 
-    df = df.set_index("date").sort_index()
-
     candidate_cols = ["AWS", "Microsoft", "Google", "Meta"]
     value_cols = [c for c in candidate_cols if c in df.columns]
     if not value_cols:
@@ -218,11 +256,11 @@ def load_hyperscaler_capex() -> pd.Series | None:
         print("⚠️ No usable provider columns in hyperscaler_capex.csv.")
         return None
 
-    total = df[value_cols].sum(axis=1)
-    total.name = "Capex_Hyperscaler"
+    total = sum_by_date(df["date"], df[value_cols], "Capex_Hyperscaler")
 
-    monthly_idx = pd.date_range(total.index.min(), total.index.max(), freq="M")
-    total_m = total.reindex(monthly_idx).ffill()
+    monthly_idx = pd.date_range(total.index.min(), total.index.max(), freq="ME")
+    # Totals have no gaps, so the fill can happen inside reindex itself
+    total_m = total.reindex(monthly_idx, method="ffill")
     total_m.index.name = "Date"
     total_m = scale_to_index(total_m, BASELINE_DATE, "Capex_Hyperscaler")
     total_m.name = "Capex_Hyperscaler"
@@ -239,7 +277,7 @@ def load_fab_capex() -> pd.Series | None:
         return None
 
     try:
-        df = pd.read_csv(csv_path)
+        df = _read_raw_csv(csv_path)
     except Exception as e:
         print(f"⚠️ Failed to read {csv_path}: {e}")
         return None
@@ -249,13 +287,11 @@ def load_fab_capex() -> pd.Series | None:
         return None
 
     try:
-        df["date"] = pd.to_datetime(df["Year"].astype(str) + "-12-31")
+        df["date"] = _year_end(df["Year"])
     except Exception as e:
         print(f"⚠️ Failed to convert 'Year' to dates in fab_capex.csv: {e}")
         return None
 
-    df = df.set_index("date").sort_index()
-
     candidate_cols = ["TSMC", "Samsung", "Intel"]
     value_cols = [c for c in candidate_cols if c in df.columns]
     if not value_cols:
@@ -266,11 +302,11 @@ def load_fab_capex() -> pd.Series | None:
         print("⚠️ No usable fab columns in fab_capex.csv.")
         return None
 
-    total = df[value_cols].sum(axis=1)
-    total.name = "Capex_Fab_Raw"
+    total = sum_by_date(df["date"], df[value_cols], "Capex_Fab_Raw")
 
-    monthly_idx = pd.date_range(total.index.min(), total.index.max(), freq="M")
-    total_m = total.reindex(monthly_idx).ffill()
+    monthly_idx = pd.date_range(total.index.min(), total.index.max(), freq="ME")
+    # Totals have no gaps, so the fill can happen inside reindex itself
+    total_m = total.reindex(monthly_idx, method="ffill")
     total_m.index.name = "Date"
 
     total_m = scale_to_index(total_m, BASELINE_DATE, "Capex_Fab_Index")
@@ -288,7 +324,7 @@ def load_dc_cost_index() -> pd.Series | None:
         return None
 
     try:
-        df = pd.read_csv(csv_path)
+        df = _read_raw_csv(csv_path)
     except Exception as e:
         print(f"⚠️ Failed to read {csv_path}: {e}")
         return None
@@ -317,7 +353,7 @@ def load_dc_cost_index() -> pd.Series | None:
     s = df[value_col].copy()
     s.name = "Capex_DC_Cost_Raw"
 
-    monthly_idx = pd.date_range(s.index.min(), s.index.max(), freq="M")
+    monthly_idx = pd.date_range(s.index.min(), s.index.max(), freq="ME")
     s_m = s.reindex(monthly_idx).ffill()
     s_m.index.name = "Date"
 
@@ -337,7 +373,7 @@ def main():
     core_df = fetch_fred_block(fred, CORE_FRED_SERIES, label="core_macro")
     if core_df is None:
         print("⚠️ Falling back to synthetic macro capex index (constant 100).")
-        idx = pd.date_range("1980-01-31", periods=12 * 10, freq="M")
+        idx = pd.date_range("1980-01-31", periods=12 * 10, freq="ME")
         macro_index = pd.Series(100.0, index=idx, name="Capex_Macro_Comp")
     else:
         macro_index = build_macro_block_index(core_df, "Capex_Macro_Comp")
@@ -401,6 +437,9 @@ def main():
     print(df.tail(10))
 
     df.to_csv(OUT_PATH, index_label="Date")
+
+    write_parquet_copy(df, OUT_PATH)
+
     print(f"💾 Wrote {OUT_PATH} with columns: {list(df.columns)} (rows={len(df)})")
 
 
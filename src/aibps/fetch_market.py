@@ -1,6 +1,7 @@
 # src/aibps/fetch_market.py
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -8,13 +9,25 @@ import numpy as np
 import pandas as pd
 import yfinance as yf
 
+if __package__:
+    from .monthly import rebase_100
+    from .parquet_copy import write_parquet_copy
+else:
+    from monthly import rebase_100
+    from parquet_copy import write_parquet_copy
+
 DATA_DIR = Path("data")
 RAW_OUT = DATA_DIR / "raw" / "market_prices.csv"
 PROC_OUT = DATA_DIR / "processed" / "market_processed.csv"
+CACHE_DIR = DATA_DIR / "cache" / "yf"
 
 # Go back to your birth year 🙂
 START = "1980-01-01"
 
+# Incremental refreshes re-download this many days before the cached end,
+# so the splice has overlapping bars to line the two panels up on
+OVERLAP_DAYS = 7
+
 # Broad + growth/speculative proxies
 # ^GSPC: S&P 500
 # ^IXIC: Nasdaq Composite
@@ -24,51 +37,166 @@ START = "1980-01-01"
 TICKERS: List[str] = ["^GSPC", "^IXIC", "^NDX", "QQQ", "ARKK"]
 
 
-def _fetch_one(ticker: str, start: str) -> pd.Series | None:
-    """Fetch one ticker's adjusted close as a monthly series."""
+def _yf_closes(tickers: List[str], start: str) -> pd.DataFrame | None:
+    """
+    Daily adjusted closes for all tickers (one column each) since `start`.
+
+    One multi-ticker yf.download call (yfinance threads it internally)
+    replaces a request per ticker.
+    """
     try:
-        df = yf.download(ticker, start=start, auto_adjust=True, progress=False)
+        df = yf.download(tickers, start=start, auto_adjust=True, progress=False, threads=True)
     except Exception as e:
-        print(f"⚠️ yfinance exception for {ticker}: {e}")
+        print(f"⚠️ yfinance exception for {tickers}: {e}")
         return None
 
-    if df is None or df.empty or "Close" not in df.columns:
-        print(f"⚠️ Empty/invalid data for {ticker}; skipping.")
+    if df is None or df.empty or "Close" not in df.columns.get_level_values(0):
+        print("⚠️ Empty/invalid yfinance data; skipping.")
         return None
 
-    s = df["Close"].copy()
-    s.index = pd.to_datetime(s.index)
-    s.index.name = "date"
+    closes = df["Close"]
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(name=tickers[0])
+    closes = closes.reindex(columns=tickers)
+    # yfinance already returns a DatetimeIndex; only convert anything else
+    if not isinstance(closes.index, pd.DatetimeIndex):
+        closes.index = pd.to_datetime(closes.index)
+    closes.index.name = "date"
+    closes.columns.name = None
+    return closes
+
+
+def _splice(cached: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame | None:
+    """
+    Append freshly downloaded bars to a cached panel.
+
+    auto_adjust back-adjusts the whole history whenever a dividend or split
+    lands, so the cached closes are rescaled per ticker by new/old on the
+    last overlapping day before the splice. Returns None if some ticker has
+    cached data but no overlapping bar (the caller then re-downloads all).
+    """
+    common = cached.index.intersection(new.index)
+    old_c = cached.loc[common]
+    new_c = new.loc[common]
+    both = old_c.notna() & new_c.notna()
+
+    factor = pd.Series(1.0, index=cached.columns)
+    for t in cached.columns:
+        if not cached[t].notna().any():
+            continue
+        if not both[t].any():
+            return None
+        last = both.index[both[t].to_numpy()][-1]
+        factor[t] = new_c.at[last, t] / old_c.at[last, t]
+
+    head = cached[cached.index < new.index.min()] * factor
+    return pd.concat([head, new]).reindex(columns=cached.columns)
+
+
+def _read_panel(path: Path, tickers: List[str]) -> pd.DataFrame | None:
+    """
+    A cached close panel, or None if it holds other tickers or can't be read
+    (e.g. a file truncated by an interrupted run); the caller then downloads.
+    """
+    try:
+        panel = pd.read_parquet(path)
+    except (ImportError, OSError, ValueError):
+        # pyarrow's ArrowInvalid (corrupt/truncated file) is a ValueError
+        return None
+    if list(panel.columns) != list(tickers) or panel.empty:
+        return None
+    return panel
+
+
+def _download_closes(tickers: List[str], start: str) -> pd.DataFrame | None:
+    """
+    Daily adjusted closes for all tickers, served from CACHE_DIR when possible.
+
+    The panel is cached for the day, so same-day re-runs don't hit Yahoo
+    again. On a later day only the bars since the newest cached panel
+    (minus OVERLAP_DAYS) are downloaded and spliced on; the full history is
+    fetched when there is no usable cache.
+    """
+    path = CACHE_DIR / f"{pd.Timestamp.today():%Y%m%d}_market.parquet"
+    if path.exists():
+        cached = _read_panel(path, tickers)
+        if cached is not None:
+            print(f"ℹ️ Using cached market closes: {path}")
+            return cached
+
+    # Newest earlier panel (file names sort by date)
+    previous = None
+    older = sorted(p for p in CACHE_DIR.glob("*_market.parquet") if p != path)
+    if older:
+        previous = _read_panel(older[-1], tickers)
+
+    closes = None
+    if previous is not None:
+        since = (previous.index.max() - pd.Timedelta(days=OVERLAP_DAYS)).strftime("%Y-%m-%d")
+        new = _yf_closes(tickers, since)
+        if new is not None:
+            closes = _splice(previous, new)
+            if closes is None:
+                print("ℹ️ Cached market panel does not overlap the new bars; re-downloading all.")
+            else:
+                print(f"ℹ️ Refreshed cached market closes from {since}")
+
+    if closes is None:
+        closes = _yf_closes(tickers, start)
+        if closes is None:
+            return None
 
-    # Monthly: last close of each month
-    s = s.resample("M").last().dropna()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write aside and swap in, so an interrupted run never leaves a partial file
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        closes.to_parquet(tmp)
+        os.replace(tmp, path)
+        # The new panel supersedes the older ones
+        for p in older:
+            p.unlink(missing_ok=True)
+    except ImportError:
+        pass
+    return closes
+
+
+def _monthly_close(s: pd.Series, ticker: str) -> pd.Series | None:
+    """
+    One ticker's daily closes as a monthly (last close of month) series.
+
+    Same result as s.resample("ME").last().dropna() on the date-sorted panel,
+    without resample's bin grid: keep each month's last non-NaN bar and
+    stamp it with the month end.
+    """
+    s = s.dropna()
+    idx = s.index
+    key = (idx.year * 12 + idx.month).to_numpy()
+    last_in_month = np.append(key[1:] != key[:-1], True) if len(key) else np.zeros(0, dtype=bool)
+    s = s[last_in_month]
+    s.index = s.index.normalize() + pd.offsets.MonthEnd(0)
 
     if s.empty:
-        print(f"⚠️ No monthly data for {ticker} after resample; skipping.")
+        print(f"⚠️ Empty/invalid data for {ticker}; skipping.")
         return None
 
     s.name = ticker
     return s
 
 
-def _rebase_100(s: pd.Series) -> pd.Series:
-    s = s.sort_index()
-    if not s.notna().any():
-        return s * np.nan
-    first = s.dropna().iloc[0]
-    if not np.isfinite(first) or first == 0:
-        return s * np.nan
-    return (s / first) * 100.0
-
-
 def main():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     RAW_OUT.parent.mkdir(parents=True, exist_ok=True)
     PROC_OUT.parent.mkdir(parents=True, exist_ok=True)
 
+    closes = _download_closes(TICKERS, START)
+
     frames: List[pd.Series] = []
     for t in TICKERS:
-        s = _fetch_one(t, START)
+        if closes is None:
+            print(f"⚠️ Empty/invalid data for {t}; skipping.")
+            continue
+        # _monthly_close drops the NaNs once and reports an empty ticker itself
+        s = _monthly_close(closes[t], t)
         if s is not None:
             frames.append(s)
 
@@ -86,7 +214,7 @@ def main():
     print(f"   Date span: {wide.index.min().date()} → {wide.index.max().date()}")
 
     # Rebase each series to 100 at its own first valid point
-    rebased = wide.apply(_rebase_100)
+    rebased = rebase_100(wide)
     # Give friendly column names for debug
     rename_map = {col: f"Mkt_{col.replace('^', '')}_idx" for col in rebased.columns}
     rebased = rebased.rename(columns=rename_map)
@@ -103,6 +231,9 @@ def main():
     print(f"✅ Market composite span: {out.index.min().date()} → {out.index.max().date()}")
 
     out.to_csv(PROC_OUT)
+
+    write_parquet_copy(out, PROC_OUT)
+
     print(f"💾 Wrote {PROC_OUT} (rows={len(out)}) with columns: {list(out.columns)}")
 
 
@@ -9,45 +9,71 @@ import os, sys, time
 import numpy as np
 import pandas as pd
 
+if __package__:
+    from .parquet_copy import write_parquet_copy
+else:
+    from parquet_copy import write_parquet_copy
+
 RAW_DIR = os.path.join("data","raw")
 PRO_DIR = os.path.join("data","processed")
+CACHE_DIR = os.path.join("data","cache","yf")
 os.makedirs(RAW_DIR, exist_ok=True); os.makedirs(PRO_DIR, exist_ok=True)
 
 START   = "2015-01-01"
 TICKERS = ["SOXX","QQQ"]
+SYNTH_SEED = 42  # seed for the generated fallback prices
 
-def rolling_pct_rank(series: pd.Series, window: int) -> pd.Series:
-    def _rank_last(x):
-        s = pd.Series(x)
-        return float(s.rank(pct=True).iloc[-1] * 100.0)
-    return series.rolling(window, min_periods=max(24, window//4)).apply(_rank_last, raw=False)
+def rolling_pct_rank(data, window: int):
+    # Windowed rank keeps a sorted skip-list of the window (O(log w) add/evict)
+    # instead of re-ranking every window from scratch; works on a Series or
+    # on every column of a DataFrame at once
+    return data.rolling(window, min_periods=max(24, window//4)).rank(pct=True) * 100.0
 
 def compute_percentiles(mon_12m: pd.DataFrame) -> pd.DataFrame:
-    out = pd.DataFrame(index=mon_12m.index)
-    for col in mon_12m.columns:
-        s = mon_12m[col]
-        p120 = rolling_pct_rank(s, 120)
-        p60  = rolling_pct_rank(s, 60)
-        p36  = rolling_pct_rank(s, 36)
-        p = p120.fillna(p60).fillna(p36)
-        out[f"MKT_{col}_1y_pct"] = p
-    return out
+    # Rank all tickers per window in one frame-wide call instead of per column
+    p120 = rolling_pct_rank(mon_12m, 120)
+    p60  = rolling_pct_rank(mon_12m, 60)
+    p36  = rolling_pct_rank(mon_12m, 36)
+    out = p120.fillna(p60).fillna(p36)
+    return out.rename(columns=lambda c: f"MKT_{c}_1y_pct")
 
 def download_live():
+    # Same-day re-runs read the cached panel instead of hitting Yahoo again
+    cache_path = os.path.join(CACHE_DIR, f"{pd.Timestamp.today():%Y%m%d}_market_safe.parquet")
+    if os.path.exists(cache_path):
+        try:
+            cached = pd.read_parquet(cache_path)
+            print(f"ℹ️ Using cached market closes: {cache_path}")
+            return cached
+        except (ImportError, OSError, ValueError):
+            # Unreadable (e.g. truncated) cache, or no pyarrow: download instead
+            pass
     try:
         import yfinance as yf
-        frames = []
+        # One multi-ticker request (threaded inside yfinance) instead of one per ticker
+        df = yf.download(TICKERS, start=START, auto_adjust=True, progress=False, threads=True)
+        if df is None or df.empty or "Close" not in df.columns.get_level_values(0):
+            print("⚠️ yfinance returned no closes"); return None
+        daily = df["Close"].reindex(columns=TICKERS)
         for t in TICKERS:
-            df = yf.download(t, start=START, auto_adjust=True, progress=False)
-            if df is None or df.empty or "Close" not in df:
-                print(f"⚠️ yfinance empty for {t}; skipping"); continue
-            s = df["Close"]
-            s.index = pd.to_datetime(s.index); s.index.name = "Date"
-            frames.append(s.to_frame(name=t))
-        if not frames:
+            if not daily[t].notna().any():
+                print(f"⚠️ yfinance empty for {t}; skipping")
+        daily = daily.dropna(axis=1, how="all")
+        if daily.empty:
             return None
-        daily = pd.concat(frames, axis=1).sort_index()
+        if not isinstance(daily.index, pd.DatetimeIndex):
+            daily.index = pd.to_datetime(daily.index)
         daily.index.name = "Date"
+        daily.columns.name = None
+        daily = daily.sort_index()
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Write aside and swap in, so an interrupted run never leaves a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            daily.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except ImportError:
+            pass
         return daily
     except Exception as e:
         print(f"⚠️ yfinance failed: {e}")
@@ -58,30 +84,38 @@ def load_sample_or_generate():
     if os.path.exists(sample):
         print(f"ℹ️ Using sample market file: {sample}")
         return pd.read_csv(sample, index_col=0, parse_dates=True).sort_index()
-    idx = pd.date_range("2015-01-31","2025-12-31",freq="M")
-    soxx = np.linspace(100,400,len(idx)) + np.random.normal(0,10,len(idx))
-    qqq  = np.linspace( 90,380,len(idx)) + np.random.normal(0,10,len(idx))
+    idx = pd.date_range("2015-01-31","2025-12-31",freq="ME")
+    # Seeded PCG64 generator: the synthetic fallback is the same on every run
+    rng = np.random.default_rng(SYNTH_SEED)
+    soxx = np.linspace(100,400,len(idx)) + rng.normal(0,10,len(idx))
+    qqq  = np.linspace( 90,380,len(idx)) + rng.normal(0,10,len(idx))
     return pd.DataFrame({"SOXX":soxx,"QQQ":qqq}, index=idx)
 
 def main():
     print("MARKER fetch_market_safe.py — pandas", pd.__version__)
     t0 = time.time()
 
+    # Both sources already return a date-sorted frame
     daily = download_live() or load_sample_or_generate()
-    daily = daily.sort_index()
 
     # Save raw daily
     raw_path = os.path.join(RAW_DIR,"market_prices.csv")
     daily.to_csv(raw_path)
     print(f"💾 raw → {raw_path}  rows={len(daily)}  cols={list(daily.columns)}")
 
-    # Month-end closes -> 12m change
-    monthly = daily.resample("M").last()
-    mon_12m = monthly.pct_change(12) * 100.0
+    # Month-end closes -> 12m change (resampled first, so the division runs
+    # on ~12 rows/year; pct_change's default pad-fill is kept via ffill)
+    monthly = daily.resample("ME").last()
+    lvl = monthly.ffill().to_numpy(dtype=np.float64)
+    chg = np.full_like(lvl, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chg[12:] = (lvl[12:] / lvl[:-12] - 1.0) * 100.0
+    mon_12m = pd.DataFrame(chg, index=monthly.index, columns=monthly.columns)
 
     out = compute_percentiles(mon_12m).dropna(how="all")
     pro_path = os.path.join(PRO_DIR,"market_processed.csv")
     out.to_csv(pro_path)
+    write_parquet_copy(out, pro_path)
     print(f"💾 processed → {pro_path}  rows={len(out)}  cols={list(out.columns)}")
     print(f"⏱  Done in {time.time()-t0:.2f}s")
 
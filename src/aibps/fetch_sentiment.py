@@ -31,7 +31,27 @@ Output:
 
 import os
 import sys
-import pandas as pd
+
+OUT_PATH = "data/processed/sentiment_processed.csv"
+
+OUTPUT_COLUMNS = ["Sentiment_Consumer", "Sentiment_EPU", "Sentiment_VIX", "Sentiment"]
+
+if __package__:
+    from .parquet_copy import remove_parquet_copy, write_parquet_copy
+else:
+    from parquet_copy import remove_parquet_copy, write_parquet_copy
+
+if __name__ == "__main__" and not os.getenv("FRED_API_KEY"):
+    # Same no-key fast path as fetch_adoption.py
+    print("⚠️ FRED_API_KEY not set; cannot fetch Sentiment data from FRED.")
+    os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
+    with open(OUT_PATH, "w") as f:
+        f.write(",".join(["Date"] + OUTPUT_COLUMNS) + "\n")
+    remove_parquet_copy(OUT_PATH)
+    print(f"💾 Wrote empty {OUT_PATH} (no FRED client).")
+    sys.exit(0)
+
+import pandas as pd  # noqa: E402
 
 try:
     from fredapi import Fred
@@ -39,7 +59,6 @@ except ImportError:
     Fred = None
 
 START_DATE = "1980-01-31"
-OUT_PATH = "data/processed/sentiment_processed.csv"
 
 # FRED IDs
 CONSUMER_ID = "UMCSENT"
@@ -100,9 +119,11 @@ def reindex_monthly(df, start_date):
     if df is None or df.empty:
         return pd.DataFrame()
 
-    df = df.copy()
-    df.index = pd.to_datetime(df.index, errors="coerce")
-    df = df[~df.index.isna()].sort_index()
+    idx = pd.to_datetime(df.index, errors="coerce")
+    keep = ~idx.isna()
+    df = df[keep]
+    df.index = idx[keep]
+    df = df.sort_index()
     if df.empty:
         return pd.DataFrame()
 
@@ -141,8 +162,8 @@ def main():
     if fred is None:
         # Write an empty shell file so downstream steps don't blow up.
         os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
-        empty_cols = ["Sentiment_Consumer", "Sentiment_EPU", "Sentiment_VIX", "Sentiment"]
-        pd.DataFrame(columns=empty_cols).to_csv(OUT_PATH, index_label="Date")
+        pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(OUT_PATH, index_label="Date")
+        remove_parquet_copy(OUT_PATH)
         print(f"💾 Wrote empty {OUT_PATH} (no FRED client).")
         return 0
 
@@ -157,8 +178,8 @@ def main():
     if combined.empty:
         print("⚠️ All Sentiment sub-series empty; writing empty sentiment_processed.csv.")
         os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
-        empty_cols = ["Sentiment_Consumer", "Sentiment_EPU", "Sentiment_VIX", "Sentiment"]
-        pd.DataFrame(columns=empty_cols).to_csv(OUT_PATH, index_label="Date")
+        pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(OUT_PATH, index_label="Date")
+        remove_parquet_copy(OUT_PATH)
         print(f"💾 Wrote empty {OUT_PATH}")
         return 0
 
@@ -186,6 +207,9 @@ def main():
     # Write output
     os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
     monthly.to_csv(OUT_PATH, index_label="Date")
+
+    write_parquet_copy(monthly, OUT_PATH)
+
     print(
         f"💾 Wrote {OUT_PATH} with {len(monthly)} rows and columns: "
         f"{list(monthly.columns)}"
@@ -0,0 +1,81 @@
+# src/aibps/fred_cache.py
+"""
+On-disk cache of raw FRED responses, shared by the fetch scripts.
+
+There is one Parquet file per series, data/cache/fred/<sid>.parquet. It is
+served while younger than CACHE_TTL_SECONDS; otherwise the series is
+downloaded again and the file is overwritten, so the cache never grows
+beyond one file per series.
+
+The TTL defaults to 30 days, matching the monthly release cadence of the
+series these scripts pull. Set AIBPS_FRED_CACHE_TTL_DAYS (e.g. to 1, or 0
+to always re-download) to pick up a release sooner.
+
+data/cache is not committed and the scheduled workflow starts from a fresh
+checkout, so this only saves requests on repeated local runs.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+CACHE_DIR = Path("data") / "cache" / "fred"
+CACHE_TTL_SECONDS = float(os.getenv("AIBPS_FRED_CACHE_TTL_DAYS", "30")) * 24 * 3600
+
+# Concurrent FRED requests (the calls are network-bound)
+MAX_WORKERS = 8
+
+
+def cached_get_series(fred, sid: str, observation_start: str | None = None) -> pd.Series:
+    """
+    fred.get_series(sid, observation_start=...), served from CACHE_DIR when fresh.
+
+    The cached file holds the full series and `observation_start` is applied
+    locally, so every script asking for `sid` shares one file whatever its
+    start date. Without pyarrow the cache is bypassed; request failures
+    propagate to the caller.
+    """
+    path = CACHE_DIR / f"{sid}.parquet"
+    ser = None
+    if path.exists() and time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+        try:
+            ser = pd.read_parquet(path)[sid]
+        except ImportError:
+            pass
+
+    if ser is None:
+        ser = fred.get_series(sid)
+        if ser is not None and len(ser) > 0:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # Write aside and swap in, so a reader never sees a partial file
+                tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                pd.DataFrame({sid: ser}).to_parquet(tmp)
+                os.replace(tmp, path)
+            except ImportError:
+                pass
+
+    if ser is not None and observation_start is not None:
+        ser = ser[ser.index >= pd.Timestamp(observation_start)]
+    return ser
+
+
+def get_series_concurrently(fred, sids, observation_start: str | None = None) -> dict[str, Future]:
+    """
+    cached_get_series for every id in `sids`, run on a small thread pool.
+
+    Returns {sid: Future} once every request has finished. Callers read the
+    results (or exceptions) in their own order, so their log output and
+    failure handling stay sequential.
+    """
+    sids = list(dict.fromkeys(sids))
+    if not sids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(sids))) as pool:
+        futures = {sid: pool.submit(cached_get_series, fred, sid, observation_start) for sid in sids}
+    return futures
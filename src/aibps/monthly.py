@@ -0,0 +1,109 @@
+# src/aibps/monthly.py
+"""
+Monthly alignment helpers shared by the FRED fetch scripts.
+
+- to_monthly: pad-fill raw series onto one month-end grid.
+- stack_monthly: the same grid, keeping only months with some data.
+- rebase_100: rebase each column to 100 at its first valid value.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def to_monthly(raw: dict[str, pd.Series], start: str) -> pd.DataFrame:
+    """
+    Convert FRED series (annual, quarterly, or monthly) to one end-of-month
+    monthly DataFrame via forward fill, starting at `start`.
+
+    Same result as `resample("ME").ffill()` per series followed by an
+    outer-join concat: every series is pad-filled onto one shared month-end
+    grid (a NaN observation stays NaN, it is not filled over) and the
+    columns are stacked into a single array. Months outside a series' own
+    span stay NaN, so a series that stops updating is not carried forward
+    to the end of the longer ones.
+    """
+    month_end = pd.offsets.MonthEnd(0)
+    series = {}
+    for name, s in raw.items():
+        s = pd.Series(s, dtype="float64").sort_index()
+        s.index = pd.to_datetime(s.index)
+        series[name] = s
+
+    spans = {
+        name: (s.index[0].normalize() + month_end, s.index[-1].normalize() + month_end)
+        for name, s in series.items()
+        if len(s)
+    }
+    if not spans:
+        return pd.DataFrame(columns=list(series), index=pd.DatetimeIndex([], name="date"), dtype="float64")
+    grid = pd.date_range(
+        min(lo for lo, _ in spans.values()),
+        max(hi for _, hi in spans.values()),
+        freq="ME",
+        name="date",
+    )
+
+    vals = np.full((len(grid), len(series)), np.nan)
+    covered = np.zeros(len(grid), dtype=bool)
+    for j, (name, s) in enumerate(series.items()):
+        if name not in spans:
+            continue
+        lo, hi = spans[name]
+        outside = (grid < lo) | (grid > hi)
+        vals[:, j] = s.reindex(grid, method="ffill").to_numpy(dtype=np.float64)
+        vals[outside, j] = np.nan
+        covered |= ~outside
+
+    # Like the outer join, keep only months inside at least one series' span
+    df = pd.DataFrame(vals[covered], index=grid[covered], columns=list(series))
+    return df[df.index >= pd.to_datetime(start)]
+
+
+def stack_monthly(raw: dict[str, pd.Series]) -> pd.DataFrame:
+    """
+    Month-end, forward-filled block of several series (one column each).
+
+    Same result as `resample("ME").ffill()` per series followed by an
+    outer-join concat, but every series is filled onto one shared month-end
+    grid and the columns are stacked into a single array: no per-series
+    frames and no index unions. Months outside a series' own span stay NaN.
+    """
+    month_end = pd.offsets.MonthEnd(0)
+    bounds = {
+        name: (s.index[0].normalize() + month_end, s.index[-1].normalize() + month_end)
+        for name, s in raw.items()
+    }
+    grid = pd.date_range(
+        min(lo for lo, _ in bounds.values()),
+        max(hi for _, hi in bounds.values()),
+        freq="ME",
+    )
+
+    cols = []
+    for name, s in raw.items():
+        lo, hi = bounds[name]
+        arr = s.reindex(grid, method="ffill").to_numpy(dtype=np.float64)
+        arr[(grid < lo) | (grid > hi)] = np.nan
+        cols.append(arr)
+
+    combined = pd.DataFrame(np.column_stack(cols), index=grid, columns=list(raw))
+    return combined.dropna(how="all")
+
+
+def rebase_100(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rebase each column so that its first non-NaN value = 100.
+
+    Columns with no data, or a zero / non-finite first value, come out all-NaN.
+    """
+    vals = df.to_numpy(dtype=float)
+    out = np.full(vals.shape, np.nan)
+    if len(vals):
+        valid = ~np.isnan(vals)
+        first = vals[valid.argmax(axis=0), np.arange(vals.shape[1])]
+        ok = valid.any(axis=0) & np.isfinite(first) & (first != 0)
+        out[:, ok] = (vals[:, ok] / first[ok]) * 100.0
+    return pd.DataFrame(out, index=df.index, columns=df.columns)
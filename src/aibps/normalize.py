@@ -10,7 +10,9 @@ Key methods:
 - rolling_percentile: percentile vs a ROLLING window.
 - rolling_z: rolling z-score (abnormality vs recent mean).
 - sigmoid_z: rolling z-score passed through a logistic to get 0–100.
+- sigmoid_z_frame: sigmoid_z over several columns sharing one window.
 - minmax_scale_0_100: simple min-max scaling to 0–100.
+- passthrough: inputs that are already 0–100 heat scores, used as-is.
 
 Use `normalize_series(series, method=..., **kwargs)` as the main entry point.
 """
@@ -47,15 +49,9 @@ def expanding_percentile(series: pd.Series) -> pd.Series:
     if s.empty:
         return series.astype(float) * np.nan
 
-    vals = []
-    idxs = []
-    for i in range(len(s)):
-        window = s.iloc[: i + 1]
-        pct = window.rank(pct=True).iloc[-1] * 100.0
-        vals.append(float(pct))
-        idxs.append(s.index[i])
-
-    core = pd.Series(vals, index=idxs)
+    # pandas' expanding rank (skip-list kernel, ties averaged) replaces
+    # re-ranking every prefix in Python
+    core = s.astype("float64").expanding().rank(pct=True) * 100.0
     core = core.clip(0.0, 100.0)
     return _align_output(series, core)
 
@@ -74,11 +70,9 @@ def rolling_percentile(series: pd.Series, window: int = 60, min_periods: int | N
     if min_periods is None:
         min_periods = max(10, window // 4)
 
-    def _rank_last(x):
-        xx = pd.Series(x)
-        return float(xx.rank(pct=True).iloc[-1] * 100.0)
-
-    core = s.rolling(window=window, min_periods=min_periods).apply(_rank_last, raw=False)
+    # pandas' windowed rank (skip-list kernel) gives the same tie-averaged pct
+    # rank of the last value as re-ranking each window in Python
+    core = s.rolling(window=window, min_periods=min_periods).rank(pct=True) * 100.0
     core = core.clip(0.0, 100.0)
     return _align_output(series, core)
 
@@ -164,11 +158,81 @@ def sigmoid_z(
     return _align_output(series, core)
 
 
+def sigmoid_z_frame(
+    frame: pd.DataFrame,
+    window: int = 24,
+    min_periods: int | None = None,
+    z_clip: float = 4.0,
+) -> pd.DataFrame:
+    """
+    `sigmoid_z` applied to every column of a frame that shares one window.
+
+    The rolling mean/std run once over the 2-D block and the clip + logistic
+    are applied in place to the whole array, instead of one pass per column.
+
+    `sigmoid_z` rolls over each column's non-null values only. Rolling over
+    rows gives the same windows when a column's observations are contiguous
+    (leading/trailing NaNs only); columns with interior gaps fall back to
+    the per-series path. Results match `sigmoid_z` up to float rounding.
+    """
+    out = pd.DataFrame(np.nan, index=frame.index, columns=frame.columns, dtype="float64")
+    if frame.empty:
+        return out
+
+    if min_periods is None:
+        min_periods = max(6, window // 4)
+
+    vals = frame.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(vals)
+    n_valid = valid.sum(axis=0)
+    first = valid.argmax(axis=0)
+    last = len(vals) - 1 - valid[::-1].argmax(axis=0)
+    contiguous = (n_valid > 0) & (n_valid == last - first + 1)
+
+    gappy = [c for c, ok, n in zip(frame.columns, contiguous, n_valid) if not ok and n > 0]
+    for col in gappy:
+        out[col] = sigmoid_z(frame[col], window=window, min_periods=min_periods, z_clip=z_clip)
+
+    if contiguous.any():
+        block = frame.loc[:, contiguous].astype("float64")
+        roll = block.rolling(window, min_periods=min_periods)
+        mean = roll.mean().to_numpy()
+        std = roll.std().to_numpy()
+
+        # z -> clip -> logistic -> 0–100, all in place on one buffer (the
+        # `mean` array is reused) instead of a fresh temporary per step
+        h = np.subtract(block.to_numpy(), mean, out=mean)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            np.divide(h, std, out=h)
+        h[np.isinf(h)] = np.nan
+        np.clip(h, -z_clip, z_clip, out=h)
+        np.negative(h, out=h)
+        np.exp(h, out=h)
+        h += 1.0
+        np.reciprocal(h, out=h)
+        h *= 100.0
+        np.clip(h, 0.0, 100.0, out=h)
+        out.loc[:, contiguous] = h
+
+    return out
+
+
+def passthrough(series: pd.Series) -> pd.Series:
+    """
+    Identity "normalization" for inputs that already are 0–100 heat scores.
+
+    Avoids re-normalizing a pre-scored series (a rolling z on a score is
+    both wasted work and a different signal); values are only clipped.
+    """
+    return series.astype(float).clip(0.0, 100.0)
+
+
 NormalizationMethod = Literal[
     "expanding_percentile",
     "rolling_percentile",
     "rolling_z_sigmoid",
     "minmax",
+    "passthrough",
 ]
 
 
@@ -186,6 +250,7 @@ def normalize_series(series: pd.Series, method: NormalizationMethod = "expanding
             - "rolling_percentile"
             - "rolling_z_sigmoid" (rolling z -> logistic 0–100)
             - "minmax"
+            - "passthrough" (already a 0–100 score; used as-is)
     kwargs : dict
         Extra keyword args passed to the underlying function.
 
@@ -211,5 +276,7 @@ def normalize_series(series: pd.Series, method: NormalizationMethod = "expanding
         lower_q = float(kwargs.get("lower_quantile", 0.01))
         upper_q = float(kwargs.get("upper_quantile", 0.99))
         return minmax_scale_0_100(series, lower_quantile=lower_q, upper_quantile=upper_q)
+    elif method == "passthrough":
+        return passthrough(series)
     else:
         raise ValueError(f"Unknown normalization method: {method}")
@@ -0,0 +1,91 @@
+# src/aibps/parquet_copy.py
+"""
+Typed Parquet copies of the processed CSV files.
+
+A processed CSV may have a sibling Parquet file (same name, .parquet) that
+readers prefer, since it loads typed columns without text/date parsing.
+The CSV stays the source of truth: each copy records the SHA-256 of the CSV
+bytes it was written alongside, and a copy is only used while that digest
+still matches the CSV on disk. Unlike file mtimes, this survives a git
+checkout or clone, which writes both files in no particular order.
+
+Writers call `write_parquet_copy` right after writing a CSV (or
+`remove_parquet_copy` after writing an empty shell CSV); readers call
+`current_parquet_copy`. The copies are git-ignored working files of a
+pipeline run: only the CSVs are committed, and the dashboard reads those.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+
+# Parquet schema-metadata key holding the digest of the CSV the copy matches
+CSV_DIGEST_KEY = b"aibps.csv_sha256"
+
+
+def parquet_path(csv_path) -> str:
+    """Path of the Parquet copy belonging to `csv_path`."""
+    return os.path.splitext(os.fspath(csv_path))[0] + ".parquet"
+
+
+def csv_digest(csv_path) -> str:
+    """SHA-256 hex digest of the CSV file's bytes."""
+    h = hashlib.sha256()
+    with open(csv_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def remove_parquet_copy(csv_path) -> None:
+    """Delete the Parquet copy of `csv_path`, if there is one."""
+    try:
+        os.remove(parquet_path(csv_path))
+    except FileNotFoundError:
+        pass
+
+
+def write_parquet_copy(df, csv_path) -> None:
+    """
+    Write `df` as the Parquet copy of the CSV just written to `csv_path`.
+
+    Without pyarrow the copy is skipped, and any older copy is removed so it
+    cannot be mistaken for the new CSV's contents.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        remove_parquet_copy(csv_path)
+        print("ℹ️ pyarrow not installed; skipping Parquet copy.")
+        return
+
+    table = pa.Table.from_pandas(df)
+    meta = dict(table.schema.metadata or {})
+    meta[CSV_DIGEST_KEY] = csv_digest(csv_path).encode()
+    pq.write_table(table.replace_schema_metadata(meta), parquet_path(csv_path))
+
+
+def current_parquet_copy(csv_path) -> str | None:
+    """
+    Path of the Parquet copy of `csv_path` if it was written from the CSV's
+    current contents; None if it is missing, stale or unreadable, or if
+    pyarrow is not installed.
+    """
+    pq_path = parquet_path(csv_path)
+    if not os.path.exists(pq_path):
+        return None
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+
+    try:
+        meta = pq.read_schema(pq_path).metadata or {}
+    except (OSError, ValueError):
+        return None
+    stored = meta.get(CSV_DIGEST_KEY)
+    if stored is None or stored.decode() != csv_digest(csv_path):
+        return None
+    return pq_path
@@ -1,10 +1,19 @@
 import os
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+if __package__:
+    from .parquet_copy import current_parquet_copy
+else:
+    from parquet_copy import current_parquet_copy
 
 ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
 PRO = os.path.join(ROOT, "data", "processed")
+SRC_PATH = os.path.join(PRO, "aibps_monthly.csv")
+RADAR_PATH = os.path.join(PRO, "radar_latest.png")
+TS_PATH = os.path.join(PRO, "aibps_timeseries.png")
 
 def radar(ax, values, labels):
     N = len(values)
@@ -18,7 +27,16 @@ def radar(ax, values, labels):
     ax.set_yticks([20, 40, 60, 80, 100])
 
 def main():
-    df = pd.read_csv(os.path.join(PRO, "aibps_monthly.csv"), index_col=0, parse_dates=True)
+    src_parquet = current_parquet_copy(SRC_PATH)
+    if src_parquet is not None:
+        # compute.py's typed copy of the composite: no CSV/date parsing
+        df = pd.read_parquet(src_parquet, engine="pyarrow")
+    else:
+        date_col = pd.read_csv(SRC_PATH, nrows=0).columns[0]
+        try:
+            df = pd.read_csv(SRC_PATH, index_col=0, parse_dates=[date_col], engine="pyarrow")
+        except ImportError:
+            df = pd.read_csv(SRC_PATH, index_col=0, parse_dates=True)
     latest = df.iloc[-1]
     pillars = ["Market", "Capex_Supply", "Infra", "Adoption", "Credit"]
     # Fill missing pillars with NaN-safe zeros for demo
@@ -27,23 +45,28 @@ def main():
             df[p] = np.nan
     df.fillna(method="ffill", inplace=True)
 
+    # Figures are drawn with the Agg canvas directly (no pyplot state machine)
     # Radar (latest)
-    fig = plt.figure(figsize=(6,6))
-    ax = plt.subplot(111, polar=True)
+    fig = Figure(figsize=(6,6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, polar=True)
     radar(ax, [latest.get(p, np.nan) for p in pillars], pillars)
     ax.set_title("AIBPS Radar — Latest")
-    fig.savefig(os.path.join(PRO, "radar_latest.png"), dpi=160)
+    fig.savefig(RADAR_PATH, dpi=160)
 
     # Time series
-    plt.figure(figsize=(9,4.5))
-    df["AIBPS"].rolling(3).mean().plot()
-    plt.axhline(50, linestyle="--", linewidth=1)
-    plt.axhline(70, linestyle="--", linewidth=1)
-    plt.axhline(85, linestyle="--", linewidth=1)
-    plt.title("AIBPS — 3M Rolling Average")
-    plt.ylabel("Score (0–100)")
-    plt.tight_layout()
-    plt.savefig(os.path.join(PRO, "aibps_timeseries.png"), dpi=160)
+    fig = Figure(figsize=(9,4.5))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ra = df["AIBPS"].rolling(3).mean()
+    ax.plot(ra.index, ra.values)
+    ax.axhline(50, linestyle="--", linewidth=1)
+    ax.axhline(70, linestyle="--", linewidth=1)
+    ax.axhline(85, linestyle="--", linewidth=1)
+    ax.set_title("AIBPS — 3M Rolling Average")
+    ax.set_ylabel("Score (0–100)")
+    fig.tight_layout()
+    fig.savefig(TS_PATH, dpi=160)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,50 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+SRC_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC_ROOT not in sys.path:
+    sys.path.insert(0, SRC_ROOT)
+
+from aibps.fetch_macro_capex import sum_by_date  # noqa: E402
+
+
+def _frame(dates, aws, meta):
+    df = pd.DataFrame({"date": pd.to_datetime(dates), "AWS": aws, "Meta": meta})
+    return df["date"], df[["AWS", "Meta"]]
+
+
+def test_duplicate_dates_are_summed():
+    dates, values = _frame(
+        ["2021-12-31", "2020-12-31", "2021-12-31"],
+        [10.0, 5.0, 1.0],
+        [2.0, np.nan, 3.0],
+    )
+    total = sum_by_date(dates, values, "Capex_Hyperscaler")
+
+    expected = pd.Series(
+        [5.0, 16.0],
+        index=pd.DatetimeIndex(["2020-12-31", "2021-12-31"]),
+        name="Capex_Hyperscaler",
+    )
+    pd.testing.assert_series_equal(total, expected)
+
+
+def test_nat_rows_are_dropped():
+    dates, values = _frame(
+        ["2021-12-31", None, "2020-12-31", None],
+        [10.0, 99.0, 5.0, 99.0],
+        [2.0, 99.0, 1.0, 99.0],
+    )
+    total = sum_by_date(dates, values, "Capex_Hyperscaler")
+
+    assert not total.index.hasnans
+    assert total.index.is_monotonic_increasing
+    assert total.tolist() == [6.0, 12.0]
+
+    # The monthly reindex in the loaders needs a monotonic index
+    monthly_idx = pd.date_range(total.index.min(), total.index.max(), freq="ME")
+    total_m = total.reindex(monthly_idx, method="ffill")
+    assert total_m.iloc[0] == 6.0 and total_m.iloc[-1] == 12.0